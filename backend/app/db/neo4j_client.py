@@ -1,12 +1,38 @@
 """Neo4j database client for Knowledge Tree."""
 
+import asyncio
 import os
-from neo4j import GraphDatabase
+from neo4j import AsyncGraphDatabase, GraphDatabase
 from typing import Optional
 
+# Constraints and indexes created by init_schema
+SCHEMA_QUERIES = [
+    # Unique constraint on Concept.id
+    """CREATE CONSTRAINT concept_id_unique IF NOT EXISTS
+       FOR (c:Concept) REQUIRE c.id IS UNIQUE""",
+    # Indexes for frequently queried fields
+    """CREATE INDEX concept_name_index IF NOT EXISTS
+       FOR (c:Concept) ON (c.name)""",
+    """CREATE INDEX concept_domain_index IF NOT EXISTS
+       FOR (c:Concept) ON (c.domain)""",
+    """CREATE INDEX concept_subfield_index IF NOT EXISTS
+       FOR (c:Concept) ON (c.subfield)""",
+    """CREATE INDEX concept_complexity_index IF NOT EXISTS
+       FOR (c:Concept) ON (c.complexity_level)""",
+    """CREATE INDEX concept_axiom_index IF NOT EXISTS
+       FOR (c:Concept) ON (c.is_axiom)""",
+    # Contribution constraints and indexes
+    """CREATE CONSTRAINT contribution_id_unique IF NOT EXISTS
+       FOR (c:Contribution) REQUIRE c.id IS UNIQUE""",
+    """CREATE INDEX contribution_user_index IF NOT EXISTS
+       FOR (c:Contribution) ON (c.user_id)""",
+    """CREATE INDEX contribution_concept_index IF NOT EXISTS
+       FOR (c:Contribution) ON (c.concept_id)""",
+]
 
-class Neo4jClient:
-    """Client for Neo4j database operations."""
+
+class _Neo4jSettings:
+    """Connection settings shared by the sync and async clients."""
 
     def __init__(
         self,
@@ -19,6 +45,10 @@ class Neo4jClient:
         self.password = password or os.getenv("NEO4J_PASSWORD", "knowledge_tree_dev")
         self._driver = None
 
+
+class Neo4jClient(_Neo4jSettings):
+    """Client for Neo4j database operations."""
+
     def connect(self):
         """Establish connection to Neo4j."""
         self._driver = GraphDatabase.driver(
@@ -45,33 +75,58 @@ class Neo4jClient:
 
     def init_schema(self):
         """Initialize the database schema with constraints and indexes."""
-        schema_queries = [
-            # Unique constraint on Concept.id
-            """CREATE CONSTRAINT concept_id_unique IF NOT EXISTS
-               FOR (c:Concept) REQUIRE c.id IS UNIQUE""",
-            # Indexes for frequently queried fields
-            """CREATE INDEX concept_name_index IF NOT EXISTS
-               FOR (c:Concept) ON (c.name)""",
-            """CREATE INDEX concept_domain_index IF NOT EXISTS
-               FOR (c:Concept) ON (c.domain)""",
-            """CREATE INDEX concept_subfield_index IF NOT EXISTS
-               FOR (c:Concept) ON (c.subfield)""",
-            """CREATE INDEX concept_complexity_index IF NOT EXISTS
-               FOR (c:Concept) ON (c.complexity_level)""",
-            """CREATE INDEX concept_axiom_index IF NOT EXISTS
-               FOR (c:Concept) ON (c.is_axiom)""",
-            # Contribution constraints and indexes
-            """CREATE CONSTRAINT contribution_id_unique IF NOT EXISTS
-               FOR (c:Contribution) REQUIRE c.id IS UNIQUE""",
-            """CREATE INDEX contribution_user_index IF NOT EXISTS
-               FOR (c:Contribution) ON (c.user_id)""",
-            """CREATE INDEX contribution_concept_index IF NOT EXISTS
-               FOR (c:Contribution) ON (c.concept_id)""",
-        ]
-        for query in schema_queries:
+        for query in SCHEMA_QUERIES:
             self.execute_query(query)
 
 
+class AsyncNeo4jClient(_Neo4jSettings):
+    """Asynchronous client for Neo4j database operations."""
+
+    def connect(self):
+        """Create the async driver; connections are opened on first use.
+
+        An existing driver is reused, so retrying connect() does not leak
+        drivers.
+        """
+        if self._driver is None:
+            self._driver = AsyncGraphDatabase.driver(
+                self.uri, auth=(self.user, self.password)
+            )
+
+    async def close(self):
+        """Close the database connection."""
+        if self._driver:
+            driver, self._driver = self._driver, None
+            await driver.close()
+
+    async def __aenter__(self):
+        self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def execute_query(self, query: str, parameters: Optional[dict] = None):
+        """Execute a Cypher query and return results."""
+        async with self._driver.session() as session:
+            result = await session.run(query, parameters or {})
+            return [record.data() async for record in result]
+
+    async def init_schema(self):
+        """Initialize the schema, sending every statement concurrently.
+
+        Every statement is awaited even if another fails; the first failure
+        is then raised.
+        """
+        results = await asyncio.gather(
+            *(self.execute_query(q) for q in SCHEMA_QUERIES),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+
 # Singleton instance
 _client: Optional[Neo4jClient] = None
 
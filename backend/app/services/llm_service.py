@@ -5,6 +5,11 @@ import json
 import os
 from dataclasses import dataclass
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - orjson is optional
+    _json_loads = json.loads
+
 
 @dataclass
 class LLMResponse:
@@ -24,17 +29,14 @@ class LLMService:
             "OPENCODE_PATH", os.path.expanduser("~/.opencode/bin/opencode")
         )
 
-    async def generate(self, prompt: str) -> LLMResponse:
-        """Generate a response from the LLM.
+    async def _run_opencode(self, prompt: str) -> tuple[bytes, bytes, int]:
+        """Run opencode on a prompt.
 
         Args:
             prompt: The prompt to send to the LLM.
 
         Returns:
-            LLMResponse containing the generated text and token counts.
-
-        Raises:
-            RuntimeError: If opencode fails or returns no text.
+            Tuple of (stdout, stderr, return code).
         """
         process = await asyncio.create_subprocess_exec(
             self._opencode_path,
@@ -47,10 +49,24 @@ class LLMService:
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
         )
-
         stdout, stderr = await process.communicate()
+        return stdout, stderr, process.returncode
+
+    async def generate(self, prompt: str) -> LLMResponse:
+        """Generate a response from the LLM.
+
+        Args:
+            prompt: The prompt to send to the LLM.
+
+        Returns:
+            LLMResponse containing the generated text and token counts.
+
+        Raises:
+            RuntimeError: If opencode fails or returns no text.
+        """
+        stdout, stderr, returncode = await self._run_opencode(prompt)
 
-        if process.returncode != 0:
+        if returncode != 0:
             raise RuntimeError(f"opencode failed: {stderr.decode()}")
 
         # Parse JSON events from stdout
@@ -58,18 +74,19 @@ class LLMService:
         input_tokens = 0
         output_tokens = 0
 
-        for line in stdout.decode().strip().split("\n"):
+        # Both decoders accept UTF-8 bytes, so lines are parsed undecoded
+        for line in stdout.strip().split(b"\n"):
             if not line:
                 continue
             try:
-                event = json.loads(line)
+                event = _json_loads(line)
                 if event.get("type") == "text":
                     text_parts.append(event["part"]["text"])
                 elif event.get("type") == "step_finish":
                     tokens = event.get("part", {}).get("tokens", {})
                     input_tokens = tokens.get("input", 0)
                     output_tokens = tokens.get("output", 0)
-            except json.JSONDecodeError:
+            except ValueError:
                 continue
 
         if not text_parts:
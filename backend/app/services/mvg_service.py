@@ -7,6 +7,11 @@ import json
 import re
 from dataclasses import dataclass
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - orjson is optional
+    _json_loads = json.loads
+
 from .llm_service import get_llm_service
 from ..db.concept import Concept, ConceptRepository
 
@@ -87,8 +92,8 @@ class MVGService:
             text = re.sub(r"\n?```$", "", text)
 
         try:
-            data = json.loads(text)
-        except json.JSONDecodeError as e:
+            data = _json_loads(text)
+        except ValueError as e:  # both decoders raise a ValueError subclass
             raise ValueError(f"Failed to parse LLM response as JSON: {e}")
 
         # Build MVGNode list, linking to existing concepts where possible
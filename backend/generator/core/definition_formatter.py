@@ -92,6 +92,8 @@ class DefinitionFormatter:
         r"\\in",
         r"\\subseteq",
     ]
+    # All patterns compiled once into a single alternation
+    _LATEX_RE = re.compile("|".join(LATEX_PATTERNS))
 
     def __init__(self, llm_client: LLMClient | None = None):
         """Initialize formatter with optional LLM client.
@@ -144,10 +146,7 @@ class DefinitionFormatter:
 
     def _has_latex(self, text: str) -> bool:
         """Check if text contains LaTeX notation."""
-        for pattern in self.LATEX_PATTERNS:
-            if re.search(pattern, text):
-                return True
-        return False
+        return self._LATEX_RE.search(text) is not None
 
     def _formalize_with_llm(self, name: str, informal_def: str, domain: str) -> str:
         """Use LLM to add proper LaTeX notation to informal definition."""
@@ -129,34 +129,17 @@ def load_seed_definitions(store: ConceptRepository, domains: list[str]) -> int:
         logger.info(f"Loading {len(seeds)} seed definitions for {domain}")
 
         for seed in seeds:
-            name = seed["name"]
+            name = seed.name
             if store.get_by_name(name):
                 logger.debug(f"Seed '{name}' already exists, skipping")
                 continue
 
-            # Create concept from seed
-            concept = {
-                "id": f"{domain.lower()}-seed-{name.lower().replace(' ', '-')}",
-                "name": name,
-                "definition_md": seed["definition_md"],
-                "domain": domain,
-                "subfield": seed.get("subfield", "general"),
-                "complexity_level": seed.get("complexity_level", 0),
-                "is_axiom": seed.get("is_axiom", False),
-                "is_verified": True,  # Seeds are pre-verified
-                "books": seed.get("books", []),
-                "papers": seed.get("papers", []),
-                "articles": [],
-                "related_concepts": [],
-                "llm_summary": "",
-            }
-
-            created = store.create(concept)
+            created = store.create(seed.to_concept())
             loaded += 1
             logger.debug(f"Loaded seed: {name}")
 
             # Link prerequisites
-            for prereq_name in seed.get("prerequisites", []):
+            for prereq_name in seed.prerequisites:
                 prereq = store.get_by_name(prereq_name)
                 if prereq:
                     store.add_requires(created["id"], prereq["id"])
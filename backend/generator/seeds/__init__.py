@@ -1,32 +1,80 @@
 """Seed definitions for the Knowledge Tree generator.
 
-Each domain module exports a list of seed definitions containing:
+Each domain module exports a tuple of AxiomSeed definitions containing:
 - Axioms and foundational concepts for the domain
 - Formal definitions in Markdown with LaTeX notation
 - Prerequisite relationships between concepts
 - Reference books and papers
 """
 
-from .mathematics import MATH_AXIOM_DEFINITIONS
-from .physics import PHYSICS_AXIOM_DEFINITIONS
-from .chemistry import CHEMISTRY_AXIOM_DEFINITIONS
-from .biology import BIOLOGY_AXIOM_DEFINITIONS
-from .computer_science import CS_AXIOM_DEFINITIONS
+from collections.abc import Mapping
 
-# Map domain names to their seed definitions
-DOMAIN_SEEDS = {
-    "MATH": MATH_AXIOM_DEFINITIONS,
-    "PHYSICS": PHYSICS_AXIOM_DEFINITIONS,
-    "CHEMISTRY": CHEMISTRY_AXIOM_DEFINITIONS,
-    "BIOLOGY": BIOLOGY_AXIOM_DEFINITIONS,
-    "CS": CS_AXIOM_DEFINITIONS,
+from . import _serde
+from ._loader import load_domain
+from ._model import AxiomSeed
+
+# Domain name -> (module, exported seed list). Domains are loaded on first
+# access so that loading one domain does not pay for parsing the others.
+_DOMAIN_MODULES = {
+    "MATH": ("mathematics", "MATH_AXIOM_DEFINITIONS"),
+    "PHYSICS": ("physics", "PHYSICS_AXIOM_DEFINITIONS"),
+    "CHEMISTRY": ("chemistry", "CHEMISTRY_AXIOM_DEFINITIONS"),
+    "BIOLOGY": ("biology", "BIOLOGY_AXIOM_DEFINITIONS"),
+    "CS": ("computer_science", "CS_AXIOM_DEFINITIONS"),
 }
+_EXPORTS = {attr: domain for domain, (_, attr) in _DOMAIN_MODULES.items()}
+
+
+class _DomainSeeds(Mapping):
+    """Read-only mapping of domain names to seed definitions, loaded on access."""
+
+    def __getitem__(self, domain: str) -> tuple[AxiomSeed, ...]:
+        module, _ = _DOMAIN_MODULES[domain]
+        return load_domain(module)
+
+    def __iter__(self):
+        return iter(_DOMAIN_MODULES)
+
+    def __len__(self) -> int:
+        return len(_DOMAIN_MODULES)
+
+
+# Map domain names to their seed definitions
+DOMAIN_SEEDS = _DomainSeeds()
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        return DOMAIN_SEEDS[_EXPORTS[name]]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_EXPORTS})
+
+
+def dump_seeds(domain: str) -> bytes:
+    """Serialize a domain's seed definitions to JSON.
+
+    Args:
+        domain: Domain name (e.g., "MATH")
+
+    Returns:
+        UTF-8 encoded JSON array of seed definitions
+    """
+    return _serde.dumps([
+        {**seed._asdict(), "definition_md": seed.definition_md}
+        for seed in DOMAIN_SEEDS[domain]
+    ])
+
 
 __all__ = [
+    "AxiomSeed",
     "MATH_AXIOM_DEFINITIONS",
     "PHYSICS_AXIOM_DEFINITIONS",
     "CHEMISTRY_AXIOM_DEFINITIONS",
     "BIOLOGY_AXIOM_DEFINITIONS",
     "CS_AXIOM_DEFINITIONS",
     "DOMAIN_SEEDS",
+    "dump_seeds",
 ]
@@ -0,0 +1,73 @@
+"""Marshal cache for seed definitions.
+
+Running ``python -m generator.seeds.build_cache`` writes ``<module>.marshal``
+next to each domain module. A cache file records the SHA-256 of the JSON
+source it was built from and is ignored once that source changes, so editing
+seed data never serves stale definitions. Rows are stored as plain tuples,
+which marshal reads back faster than pickle reads named tuples; the header
+also records AxiomSeed's field names, so a cache written for a different
+row layout is ignored rather than read into the wrong fields.
+"""
+
+import hashlib
+import marshal
+from pathlib import Path
+
+from ._model import SOURCE_DIR, AxiomSeed, interned
+
+_DIR = Path(__file__).parent
+
+
+def _source_digest(module: str) -> bytes | None:
+    try:
+        return hashlib.sha256((SOURCE_DIR / f"{module}.json").read_bytes()).digest()
+    except FileNotFoundError:
+        return None
+
+
+def load(module: str, cache_dir: Path = _DIR) -> tuple[AxiomSeed, ...] | None:
+    """Load cached definitions for a domain module.
+
+    Args:
+        module: Domain module name (e.g., "mathematics")
+        cache_dir: Directory holding the cache files
+
+    Returns:
+        The cached definitions, or None if the cache is missing, stale, or
+        was written by an incompatible Python version or AxiomSeed layout
+    """
+    try:
+        data = (cache_dir / f"{module}.marshal").read_bytes()
+        version, fields, digest, rows = marshal.loads(data)
+    except (FileNotFoundError, EOFError, ValueError, TypeError):
+        return None
+    if version != marshal.version or fields != AxiomSeed._fields:
+        return None
+    source = _source_digest(module)
+    if source is not None and source != digest:
+        return None
+    try:
+        return interned(map(AxiomSeed._make, rows))
+    except (TypeError, ValueError):
+        return None
+
+
+def write(module: str, definitions, cache_dir: Path = _DIR) -> Path:
+    """Write the cache file for a domain module.
+
+    Args:
+        module: Domain module name (e.g., "mathematics")
+        definitions: Seed definitions built from that module
+        cache_dir: Directory to write the cache file to
+
+    Returns:
+        Path of the written cache file
+    """
+    path = cache_dir / f"{module}.marshal"
+    rows = tuple(tuple(d) for d in definitions)
+    path.write_bytes(
+        marshal.dumps(
+            (marshal.version, AxiomSeed._fields, _source_digest(module), rows)
+        )
+    )
+    return path
@@ -0,0 +1,149 @@
+"""Prerequisite graph helpers for seed definitions.
+
+Prerequisites are encoded as integer bitmasks: bit ``j`` of ``masks[i]`` is
+set when the concept at index ``j`` is a direct prerequisite of the concept
+at index ``i``. The same graph is also available in compressed sparse row
+(CSR) form for traversals.
+"""
+
+import heapq
+from array import array
+from collections.abc import Sequence
+
+from ._model import AxiomSeed
+
+
+def prereq_masks(definitions: Sequence[AxiomSeed]) -> tuple[int, ...]:
+    """Encode each definition's prerequisites as a bitmask of indices.
+
+    Args:
+        definitions: Seed definitions whose prerequisites all resolve to
+            names within the same list
+
+    Returns:
+        One bitmask per definition, in list order
+    """
+    name_to_idx = {d.name: i for i, d in enumerate(definitions)}
+    return tuple(
+        sum(1 << name_to_idx[p] for p in d.prerequisites) for d in definitions
+    )
+
+
+def transitive_closure(masks: tuple[int, ...]) -> tuple[int, ...]:
+    """Compute the transitive closure of a prerequisite bitmask graph.
+
+    Args:
+        masks: Direct prerequisite bitmasks, as returned by prereq_masks
+
+    Returns:
+        Bitmasks where bit ``j`` of entry ``i`` is set when concept ``j`` is
+        a direct or indirect prerequisite of concept ``i``
+    """
+    closure = list(masks)
+    changed = True
+    while changed:
+        changed = False
+        for i, mask in enumerate(closure):
+            new = mask
+            bits = mask
+            while bits:
+                low = bits & -bits
+                new |= closure[low.bit_length() - 1]
+                bits ^= low
+            if new != mask:
+                closure[i] = new
+                changed = True
+    return tuple(closure)
+
+
+def prereq_csr(definitions: Sequence[AxiomSeed]) -> tuple[array, array]:
+    """Flatten prerequisites into compressed sparse row arrays.
+
+    Args:
+        definitions: Seed definitions whose prerequisites all resolve to
+            names within the same list
+
+    Returns:
+        ``(indptr, indices)`` where the prerequisites of concept ``i`` are
+        ``indices[indptr[i]:indptr[i + 1]]``
+    """
+    name_to_idx = {d.name: i for i, d in enumerate(definitions)}
+    indptr = array("I", [0])
+    indices = array("I")
+    for d in definitions:
+        indices.extend(name_to_idx[p] for p in d.prerequisites)
+        indptr.append(len(indices))
+    return indptr, indices
+
+
+def has_cycle(indptr: array, indices: array) -> bool:
+    """Detect a cycle in a CSR prerequisite graph.
+
+    Uses an iterative depth-first search, so every edge is visited once.
+
+    Args:
+        indptr: Row offsets, as returned by prereq_csr
+        indices: Prerequisite indices, as returned by prereq_csr
+
+    Returns:
+        True if any concept transitively requires itself
+    """
+    n = len(indptr) - 1
+    color = bytearray(n)  # 0 = unvisited, 1 = on the DFS stack, 2 = finished
+    for root in range(n):
+        if color[root]:
+            continue
+        color[root] = 1
+        stack = [(root, indptr[root])]
+        while stack:
+            node, edge = stack[-1]
+            if edge == indptr[node + 1]:
+                color[node] = 2
+                stack.pop()
+                continue
+            stack[-1] = (node, edge + 1)
+            child = indices[edge]
+            if color[child] == 1:
+                return True
+            if color[child] == 0:
+                color[child] = 1
+                stack.append((child, indptr[child]))
+    return False
+
+
+def topo_order(indptr: array, indices: array) -> tuple[int, ...]:
+    """Order a CSR prerequisite graph so prerequisites come first.
+
+    Uses Kahn's algorithm with a min-heap, so among concepts whose
+    prerequisites are all placed, the lowest index always comes next.
+
+    Args:
+        indptr: Row offsets, as returned by prereq_csr
+        indices: Prerequisite indices, as returned by prereq_csr
+
+    Returns:
+        Concept indices in topological order
+
+    Raises:
+        ValueError: If the graph contains a cycle
+    """
+    n = len(indptr) - 1
+    remaining = [indptr[i + 1] - indptr[i] for i in range(n)]
+    dependents: list[list[int]] = [[] for _ in range(n)]
+    for i in range(n):
+        for p in indices[indptr[i]:indptr[i + 1]]:
+            dependents[p].append(i)
+
+    ready = [i for i in range(n) if remaining[i] == 0]  # already a heap
+    order = []
+    while ready:
+        node = heapq.heappop(ready)
+        order.append(node)
+        for dependent in dependents[node]:
+            remaining[dependent] -= 1
+            if remaining[dependent] == 0:
+                heapq.heappush(ready, dependent)
+
+    if len(order) < n:
+        raise ValueError("Prerequisite graph contains a cycle")
+    return tuple(order)
@@ -0,0 +1,53 @@
+"""Loading of seed definitions for a domain."""
+
+import json
+from functools import lru_cache
+
+from . import _cache
+from ._graph import has_cycle, prereq_csr
+from ._model import SOURCE_DIR, AxiomSeed, interned
+
+# Domain modules that split their definitions into axioms and derived
+# concepts by position, so all axioms must come first
+_AXIOMS_FIRST = frozenset({"mathematics"})
+
+
+def load_source(module: str) -> tuple[AxiomSeed, ...]:
+    """Load a domain's seed definitions from its JSON source.
+
+    Args:
+        module: Domain module name (e.g., "mathematics")
+
+    Returns:
+        The seed definitions, with shared strings interned
+    """
+    rows = json.loads((SOURCE_DIR / f"{module}.json").read_bytes())
+    # interned() also converts the books/prerequisites lists to tuples
+    return interned(AxiomSeed(**row) for row in rows)
+
+
+@lru_cache(maxsize=None)
+def load_domain(module: str) -> tuple[AxiomSeed, ...]:
+    """Load a domain's seed definitions once per process.
+
+    A fresh marshal cache (see ``_cache``) is preferred over parsing the
+    JSON source. Either way the prerequisite graph is checked for cycles
+    (and, where the domain module relies on it, that axioms come first);
+    the checks are asserts, so ``python -O`` skips them.
+
+    Args:
+        module: Domain module name (e.g., "mathematics")
+
+    Returns:
+        The seed definitions, shared by every caller
+    """
+    definitions = _cache.load(module)
+    if definitions is None:
+        definitions = load_source(module)
+    assert not has_cycle(*prereq_csr(definitions)), (
+        f"prerequisite cycle in {module} seeds"
+    )
+    assert module not in _AXIOMS_FIRST or sorted(
+        definitions, key=lambda d: not d.is_axiom
+    ) == list(definitions), f"{module} axioms must precede derived concepts"
+    return definitions
@@ -0,0 +1,113 @@
+"""Row type for seed definitions."""
+
+import re
+import sys
+import unicodedata
+from collections.abc import Iterable
+from functools import lru_cache
+from importlib.resources import files
+from typing import NamedTuple
+
+# Canonical seed metadata lives in source/<module>.json and definition
+# bodies in definitions/<domain>/<slug>.md. Both are read as package
+# resources so they also load when the package is not on a plain filesystem.
+SOURCE_DIR = files(__package__) / "source"
+DEFINITIONS_DIR = files(__package__) / "definitions"
+
+# Canonical instances of the books/prerequisites tuples seen so far
+_TUPLE_POOL: dict[tuple[str, ...], tuple[str, ...]] = {}
+
+
+def definition_slug(name: str) -> str:
+    """Convert a concept name to the file stem of its definition.
+
+    Accented letters are folded to their base letter (``"Ampère"`` becomes
+    ``"ampere"``) before other non-alphanumerics collapse to ``_``.
+    """
+    decomposed = unicodedata.normalize("NFKD", name)
+    ascii_name = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return re.sub(r"[^a-z0-9]+", "_", ascii_name.lower()).strip("_")
+
+
+@lru_cache(maxsize=None)
+def _read_definition(domain: str, name: str) -> str:
+    path = DEFINITIONS_DIR / domain.lower() / f"{definition_slug(name)}.md"
+    return path.read_text(encoding="utf-8").removesuffix("\n")
+
+
+class AxiomSeed(NamedTuple):
+    """A seed concept definition.
+
+    ``definition_md`` is read from its Markdown file on first access, so
+    loading seeds for their metadata does not pay for the definition text.
+    It omits the ``## <name>`` heading when that would only repeat the name;
+    use render() to get the full Markdown.
+    """
+
+    name: str
+    domain: str
+    subfield: str
+    complexity_level: int
+    is_axiom: bool
+    books: tuple[str, ...]
+    prerequisites: tuple[str, ...]
+
+    @property
+    def definition_md(self) -> str:
+        """Formal definition in Markdown with LaTeX notation."""
+        return _read_definition(self.domain, self.name)
+
+    def render(self) -> str:
+        """Render the definition as Markdown with its title heading."""
+        if self.definition_md.startswith("## "):
+            return self.definition_md
+        return f"## {self.name}\n\n{self.definition_md}"
+
+    def to_concept(self) -> dict:
+        """Build the properties of the Concept node for this seed."""
+        return {
+            "id": f"{self.domain.lower()}-seed-{self.name.lower().replace(' ', '-')}",
+            "name": self.name,
+            "definition_md": self.render(),
+            "domain": self.domain,
+            "subfield": self.subfield,
+            "complexity_level": self.complexity_level,
+            "is_axiom": self.is_axiom,
+            "is_verified": True,  # Seeds are pre-verified
+            "books": list(self.books),
+            "papers": [],
+            "articles": [],
+            "related_concepts": [],
+            "llm_summary": "",
+        }
+
+
+def _pooled(values: tuple[str, ...]) -> tuple[str, ...]:
+    key = tuple(map(sys.intern, values))
+    return _TUPLE_POOL.setdefault(key, key)
+
+
+def interned(seeds: Iterable[AxiomSeed]) -> tuple[AxiomSeed, ...]:
+    """Intern the short strings that seeds share with each other.
+
+    Names, domains, subfields, book titles and prerequisite names recur
+    across seeds and are used as dict keys downstream; interning makes
+    equal values share one object. Equal ``books`` and ``prerequisites``
+    tuples are likewise shared, so they can be compared with ``is``.
+
+    Args:
+        seeds: Seed definitions to normalize
+
+    Returns:
+        The same definitions with their shared strings interned
+    """
+    return tuple(
+        seed._replace(
+            name=sys.intern(seed.name),
+            domain=sys.intern(seed.domain),
+            subfield=sys.intern(seed.subfield),
+            books=_pooled(seed.books),
+            prerequisites=_pooled(seed.prerequisites),
+        )
+        for seed in seeds
+    )
@@ -0,0 +1,26 @@
+"""JSON serialization for seed definitions.
+
+Uses ``orjson`` when it is installed and falls back to the stdlib encoder
+otherwise. Both paths produce compact UTF-8 encoded bytes.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+def dumps(obj) -> bytes:
+    """Serialize seed data to JSON.
+
+    Args:
+        obj: JSON-compatible seed data, e.g. a list of seed dicts
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
@@ -0,0 +1,165 @@
+"""Column-oriented storage for seed definitions."""
+
+from array import array
+from collections.abc import Sequence
+
+from ._graph import prereq_csr
+from ._model import AxiomSeed
+
+# Fields present on every seed definition, in declaration order
+FIELDS = AxiomSeed._fields
+
+# Packed tag layout (uint16): 1 axiom bit, 5 complexity bits, 10 subfield-id bits
+AXIOM_BIT = 1 << 15
+LEVEL_SHIFT = 10
+LEVEL_MASK = 0x1F
+SUBFIELD_MASK = 0x3FF
+_PACKED_FIELDS = ("subfield", "complexity_level", "is_axiom")
+# Fields stored in dedicated arrays instead of a column of Python objects
+_ARRAY_FIELDS = (*_PACKED_FIELDS, "prerequisites")
+
+
+class SeedTable:
+    """Struct-of-arrays view over a sequence of seed definitions.
+
+    Each field is stored as its own column so filters scan a single
+    contiguous sequence instead of visiting every row object. ``is_axiom``,
+    ``complexity_level`` and ``subfield`` are packed into a single uint16
+    ``tags`` array, with subfields numbered by their index in ``subfields``.
+    ``index`` maps each name to its row for constant-time lookup, and
+    prerequisites are stored as row indices in CSR form (see prereq_csr), so
+    every prerequisite must name a row of the same table.
+    """
+
+    def __init__(self, definitions: Sequence[AxiomSeed]):
+        self.subfields: tuple[str, ...] = tuple(
+            sorted({d.subfield for d in definitions})
+        )
+        if len(self.subfields) > SUBFIELD_MASK + 1:
+            raise ValueError(f"Too many subfields to pack: {len(self.subfields)}")
+        self._subfield_ids = {s: i for i, s in enumerate(self.subfields)}
+        self.columns: dict[str, list] = {
+            field: [getattr(d, field) for d in definitions]
+            for field in FIELDS
+            if field not in _ARRAY_FIELDS
+        }
+        self.prereq_indptr, self.prereq_indices = prereq_csr(definitions)
+        self.tags = array("H", (self._encode(d) for d in definitions))
+        self.index: dict[str, int] = {}
+        for i, name in enumerate(self.columns["name"]):
+            if self.index.setdefault(name, i) != i:
+                raise ValueError(f"Duplicate seed name: {name}")
+
+    def _encode(self, definition: AxiomSeed) -> int:
+        level = definition.complexity_level
+        if not 0 <= level <= LEVEL_MASK:
+            raise ValueError(f"Complexity level out of range: {level}")
+        return (
+            (AXIOM_BIT if definition.is_axiom else 0)
+            | (level << LEVEL_SHIFT)
+            | self._subfield_ids[definition.subfield]
+        )
+
+    def _value(self, field: str, index: int):
+        if field in self.columns:
+            return self.columns[field][index]
+        if field == "prerequisites":
+            return self.prereq_names(index)
+        if field == "is_axiom":
+            return self.is_axiom(index)
+        if field == "complexity_level":
+            return self.complexity(index)
+        if field == "subfield":
+            return self.subfields[self.tags[index] & SUBFIELD_MASK]
+        raise KeyError(f"Unknown seed field: {field}")
+
+    def complexity(self, index: int) -> int:
+        """Complexity level of a row, decoded from its tag."""
+        return (self.tags[index] >> LEVEL_SHIFT) & LEVEL_MASK
+
+    def is_axiom(self, index: int) -> bool:
+        """Whether a row is an axiom, decoded from its tag."""
+        return bool(self.tags[index] & AXIOM_BIT)
+
+    def prereqs(self, index: int) -> array:
+        """Row indices of the direct prerequisites of a row."""
+        index = range(len(self))[index]
+        return self.prereq_indices[
+            self.prereq_indptr[index]:self.prereq_indptr[index + 1]
+        ]
+
+    def prereq_names(self, index: int) -> tuple[str, ...]:
+        """Names of the direct prerequisites of a row."""
+        names = self.columns["name"]
+        return tuple(names[p] for p in self.prereqs(index))
+
+    def __contains__(self, name: object) -> bool:
+        """Check whether a concept name has a row in the table."""
+        return name in self.index
+
+    def __len__(self) -> int:
+        return len(self.tags)
+
+    def __getitem__(self, index: int) -> AxiomSeed:
+        """Materialize a single row as a seed definition."""
+        index = range(len(self))[index]
+        return AxiomSeed(*(self._value(field, index) for field in FIELDS))
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def get(self, name: str) -> AxiomSeed | None:
+        """Look up a row by concept name.
+
+        Args:
+            name: Concept name
+
+        Returns:
+            The seed definition, or None if no row has that name
+        """
+        index = self.index.get(name)
+        return None if index is None else self[index]
+
+    def query(self, **filters) -> list[int]:
+        """Find rows whose fields equal all of the given values.
+
+        Filters on packed fields are combined into a single mask compare
+        over ``tags``.
+
+        Args:
+            **filters: Field name to required value, e.g. ``complexity_level=0``
+
+        Returns:
+            Matching row indices in ascending order
+
+        Raises:
+            KeyError: If a filter names a field seeds do not have
+        """
+        unknown = filters.keys() - set(FIELDS)
+        if unknown:
+            raise KeyError(f"Unknown seed field: {', '.join(sorted(unknown))}")
+        mask = want = 0
+        if "is_axiom" in filters:
+            mask |= AXIOM_BIT
+            want |= AXIOM_BIT if filters.pop("is_axiom") else 0
+        if "complexity_level" in filters:
+            level = filters.pop("complexity_level")
+            if not 0 <= level <= LEVEL_MASK:
+                return []
+            mask |= LEVEL_MASK << LEVEL_SHIFT
+            want |= level << LEVEL_SHIFT
+        if "subfield" in filters:
+            subfield_id = self._subfield_ids.get(filters.pop("subfield"))
+            if subfield_id is None:
+                return []
+            mask |= SUBFIELD_MASK
+            want |= subfield_id
+
+        indices = [i for i, tag in enumerate(self.tags) if tag & mask == want]
+        for field, value in filters.items():
+            if field in self.columns:
+                column = self.columns[field]
+                indices = [i for i in indices if column[i] == value]
+            else:
+                indices = [i for i in indices if self._value(field, i) == value]
+        return indices
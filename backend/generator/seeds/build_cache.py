@@ -0,0 +1,17 @@
+"""Write marshal caches for every seed domain.
+
+Usage:
+    python -m generator.seeds.build_cache
+"""
+
+from . import _DOMAIN_MODULES, _cache
+from ._loader import load_source
+
+
+def main():
+    for module, _ in _DOMAIN_MODULES.values():
+        print(f"Wrote {_cache.write(module, load_source(module))}")
+
+
+if __name__ == "__main__":
+    main()
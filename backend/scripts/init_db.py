@@ -1,55 +1,141 @@
 #!/usr/bin/env python3
-"""Initialize the Neo4j database schema."""
+"""Initialize the Neo4j database schema and load the seed concepts."""
 
+import asyncio
 import sys
-import time
+from pathlib import Path
+from urllib.parse import urlsplit
 
-sys.path.insert(0, str(__file__).rsplit("/", 2)[0])
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-from app.db.neo4j_client import Neo4jClient
+from app.db.neo4j_client import AsyncNeo4jClient
+from generator.seeds import DOMAIN_SEEDS
+from generator.seeds._graph import prereq_csr, topo_order
 
+# One round trip per batch: nodes are created unless they already exist,
+# then REQUIRES edges are merged between them
+SEED_NODES_QUERY = """
+UNWIND $rows AS row
+MERGE (c:Concept {id: row.id})
+ON CREATE SET c += row
+"""
+SEED_EDGES_QUERY = """
+UNWIND $edges AS edge
+MATCH (c:Concept {id: edge.concept_id})
+MATCH (p:Concept {id: edge.prerequisite_id})
+MERGE (c)-[:REQUIRES]->(p)
+"""
 
-def wait_for_neo4j(client: Neo4jClient, max_retries: int = 30, delay: float = 2.0):
-    """Wait for Neo4j to be available."""
+
+async def wait_for_neo4j(
+    client: AsyncNeo4jClient,
+    max_retries: int = 30,
+    delay: float = 0.1,
+    max_delay: float = 2.0,
+):
+    """Wait for Neo4j to be available.
+
+    The Bolt port is probed with a plain TCP connect before the driver is
+    used, and the delay between attempts doubles up to ``max_delay``. The
+    client's driver is created once and reused across attempts.
+    """
+    uri = urlsplit(client.uri)
+    address = (uri.hostname or "localhost", uri.port or 7687)
     for i in range(max_retries):
         try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(*address), timeout=0.2
+            )
+            writer.close()
+            await writer.wait_closed()
             client.connect()
-            client.execute_query("RETURN 1")
+            await client.execute_query("RETURN 1")
             print("Neo4j is available.")
             return True
         except Exception as e:
             if i < max_retries - 1:
                 print(f"Waiting for Neo4j... ({i + 1}/{max_retries})")
-                time.sleep(delay)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, max_delay)
             else:
                 print(f"Failed to connect to Neo4j: {e}")
                 return False
     return False
 
 
-def main():
+async def _gather_all(*aws):
+    # Let every awaitable finish before surfacing the first failure, so a
+    # failing query never leaves its siblings running unobserved
+    results = await asyncio.gather(*aws, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
+
+
+async def _load_domain(client: AsyncNeo4jClient, domain: str) -> int:
+    seeds = DOMAIN_SEEDS[domain]
+    indptr, indices = prereq_csr(seeds)
+    # Prerequisites first; raises ValueError before any write if there is a cycle
+    order = topo_order(indptr, indices)
+    concepts = [seed.to_concept() for seed in seeds]
+    rows = [concepts[i] for i in order]
+    edges = [
+        {"concept_id": concepts[i]["id"], "prerequisite_id": concepts[p]["id"]}
+        for i in order
+        for p in indices[indptr[i]:indptr[i + 1]]
+    ]
+    # Edges need both endpoints, so nodes are written first
+    await client.execute_query(SEED_NODES_QUERY, {"rows": rows})
+    await client.execute_query(SEED_EDGES_QUERY, {"edges": edges})
+    print(f"Loaded {len(rows)} {domain} seeds with {len(edges)} prerequisites")
+    return len(rows)
+
+
+async def load_seeds(client: AsyncNeo4jClient) -> int:
+    """Load every domain's seed concepts with one batched query per step.
+
+    Domains are independent, so they are written concurrently; if any
+    domain fails, the others still finish before the first error is raised.
+
+    Args:
+        client: Connected Neo4j client
+
+    Returns:
+        Number of seed concepts sent to the database
+    """
+    counts = await _gather_all(
+        *(_load_domain(client, domain) for domain in DOMAIN_SEEDS)
+    )
+    return sum(counts)
+
+
+async def main():
     """Initialize the database schema."""
     print("Initializing Knowledge Tree Neo4j schema...")
 
-    client = Neo4jClient()
-
-    if not wait_for_neo4j(client):
-        sys.exit(1)
+    # The driver is closed on every exit path, including failures
+    async with AsyncNeo4jClient() as client:
+        if not await wait_for_neo4j(client):
+            sys.exit(1)
 
-    print("Creating schema constraints and indexes...")
-    client.init_schema()
-    print("Schema initialization complete.")
+        print("Creating schema constraints and indexes...")
+        await client.init_schema()
+        print("Schema initialization complete.")
 
-    # Verify schema was created
-    result = client.execute_query("SHOW CONSTRAINTS")
-    print(f"Constraints: {len(result)}")
+        # Verify schema was created; only the counts cross the wire
+        constraints, indexes = await _gather_all(
+            client.execute_query("SHOW CONSTRAINTS YIELD name RETURN count(name) AS n"),
+            client.execute_query("SHOW INDEXES YIELD name RETURN count(name) AS n"),
+        )
+        print(f"Constraints: {constraints[0]['n']}")
+        print(f"Indexes: {indexes[0]['n']}")
 
-    result = client.execute_query("SHOW INDEXES")
-    print(f"Indexes: {len(result)}")
+        print("Loading seed concepts...")
+        print(f"Seed concepts: {await load_seeds(client)}")
 
-    client.close()
     print("Done.")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
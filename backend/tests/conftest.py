@@ -0,0 +1,18 @@
+"""Shared fixtures for the backend test suite."""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def app():
+    """The FastAPI application, imported once per test session.
+
+    The import is deferred to first use so workers that only run tests
+    without the API never load it. The OpenAPI schema is built here too;
+    FastAPI caches it on the app, so later requests for /openapi.json reuse
+    this dict.
+    """
+    from app.main import app as _app
+
+    _app.openapi()
+    return _app
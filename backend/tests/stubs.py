@@ -0,0 +1,23 @@
+"""Lightweight async stubs for tests that only need a canned result."""
+
+
+def async_return(value):
+    """Build a coroutine function that ignores its arguments and returns value."""
+
+    async def _stub(*args, **kwargs):
+        return value
+
+    return _stub
+
+
+def async_raise(exc_type: type[BaseException], *args):
+    """Build a coroutine function that ignores its arguments and raises.
+
+    A fresh ``exc_type(*args)`` is raised on every call, so tracebacks do not
+    accumulate on a shared instance when the stub is reused.
+    """
+
+    async def _stub(*_args, **_kwargs):
+        raise exc_type(*args)
+
+    return _stub
@@ -8,10 +8,13 @@ from generator.core.definition_formatter import (
 )
 
 
+_DEFAULT_RESPONSE = "Mock formalized definition with $x^2$ notation."
+
+
 class MockLLMClient:
     """Mock LLM client for testing."""
 
-    def __init__(self, response: str = "Mock formalized definition with $x^2$ notation."):
+    def __init__(self, response: str = _DEFAULT_RESPONSE):
         self.response = response
         self.calls: list[str] = []
 
@@ -20,43 +23,48 @@ class MockLLMClient:
         return self.response
 
 
+@pytest.fixture(scope="module")
+def mock_llm():
+    """Mock LLM client shared by the tests in this module."""
+    return MockLLMClient()
+
+
+@pytest.fixture(scope="module")
+def formatter(mock_llm):
+    """Formatter shared by the tests in this module."""
+    return DefinitionFormatter(llm_client=mock_llm)
+
+
+@pytest.fixture(autouse=True)
+def _reset_mock_llm(mock_llm):
+    """Give every test a fresh view of the shared mock client."""
+    mock_llm.calls.clear()
+    mock_llm.response = _DEFAULT_RESPONSE
+
+
 class TestDefinitionFormatter:
     """Tests for DefinitionFormatter class."""
 
-    def test_has_latex_inline_math(self):
-        """Test detection of inline LaTeX."""
-        formatter = DefinitionFormatter(llm_client=MockLLMClient())
-        assert formatter._has_latex("The derivative is $f'(x)$")
-        assert formatter._has_latex("For all $x \\in \\mathbb{R}$")
-
-    def test_has_latex_display_math(self):
-        """Test detection of display LaTeX."""
-        formatter = DefinitionFormatter(llm_client=MockLLMClient())
-        assert formatter._has_latex("The equation is $$x^2 + y^2 = r^2$$")
-
-    def test_has_latex_environment(self):
-        """Test detection of LaTeX environments."""
-        formatter = DefinitionFormatter(llm_client=MockLLMClient())
-        assert formatter._has_latex("\\begin{equation}x = 1\\end{equation}")
-
-    def test_has_latex_commands(self):
-        """Test detection of common LaTeX commands."""
-        formatter = DefinitionFormatter(llm_client=MockLLMClient())
-        assert formatter._has_latex("The sum \\sum_{i=1}^n x_i")
-        assert formatter._has_latex("The integral \\int_0^1 f(x) dx")
-        assert formatter._has_latex("For all \\forall x")
-
-    def test_has_latex_negative(self):
-        """Test that plain text returns False."""
-        formatter = DefinitionFormatter(llm_client=MockLLMClient())
-        assert not formatter._has_latex("A vector space is a set with operations")
-        assert not formatter._has_latex("The derivative measures rate of change")
-
-    def test_format_definition_with_latex(self):
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("The derivative is $f'(x)$", True),
+            ("For all $x \\in \\mathbb{R}$", True),
+            ("The equation is $$x^2 + y^2 = r^2$$", True),
+            ("\\begin{equation}x = 1\\end{equation}", True),
+            ("The sum \\sum_{i=1}^n x_i", True),
+            ("The integral \\int_0^1 f(x) dx", True),
+            ("For all \\forall x", True),
+            ("A vector space is a set with operations", False),
+            ("The derivative measures rate of change", False),
+        ],
+    )
+    def test_has_latex(self, formatter, text, expected):
+        """Test detection of inline, display, environment and command LaTeX."""
+        assert formatter._has_latex(text) is expected
+
+    def test_format_definition_with_latex(self, formatter, mock_llm):
         """Test formatting when definition already has LaTeX."""
-        mock_llm = MockLLMClient()
-        formatter = DefinitionFormatter(llm_client=mock_llm)
-
         raw_data = RawConceptData(
             name="Derivative",
             domain="MATH",
@@ -70,10 +78,9 @@ class TestDefinitionFormatter:
         assert "## Derivative" in result
         assert "$f'(a)" in result
 
-    def test_format_definition_without_latex(self):
+    def test_format_definition_without_latex(self, formatter, mock_llm):
         """Test that LLM is called for informal definitions."""
-        mock_llm = MockLLMClient(response="A **derivative** measures the rate of change at $x$.")
-        formatter = DefinitionFormatter(llm_client=mock_llm)
+        mock_llm.response = "A **derivative** measures the rate of change at $x$."
 
         raw_data = RawConceptData(
             name="Derivative",
@@ -89,11 +96,8 @@ class TestDefinitionFormatter:
         assert "MATH" in mock_llm.calls[0]
         assert "## Derivative" in result
 
-    def test_format_definition_with_notations(self):
+    def test_format_definition_with_notations(self, formatter):
         """Test that notations are included."""
-        mock_llm = MockLLMClient()
-        formatter = DefinitionFormatter(llm_client=mock_llm)
-
         raw_data = RawConceptData(
             name="Derivative",
             domain="MATH",
@@ -108,11 +112,8 @@ class TestDefinitionFormatter:
         assert "`df/dx`" in result
         assert "`Df(a)`" in result
 
-    def test_format_definition_with_examples(self):
+    def test_format_definition_with_examples(self, formatter):
         """Test that examples are included."""
-        mock_llm = MockLLMClient()
-        formatter = DefinitionFormatter(llm_client=mock_llm)
-
         raw_data = RawConceptData(
             name="Vector Space",
             domain="MATH",
@@ -126,11 +127,8 @@ class TestDefinitionFormatter:
         assert "- $\\mathbb{R}^n$" in result
         assert "- Polynomials" in result
 
-    def test_format_definition_from_dict(self):
+    def test_format_definition_from_dict(self, formatter):
         """Test that dict input is accepted."""
-        mock_llm = MockLLMClient()
-        formatter = DefinitionFormatter(llm_client=mock_llm)
-
         raw_data = {
             "name": "Empty Set",
             "domain": "MATH",
@@ -142,10 +140,9 @@ class TestDefinitionFormatter:
         assert "## Empty Set" in result
         assert "$\\emptyset$" in result
 
-    def test_format_definition_empty_definition(self):
+    def test_format_definition_empty_definition(self, formatter, mock_llm):
         """Test that LLM generates definition when none provided."""
-        mock_llm = MockLLMClient(response="The **Hilbert space** is a complete inner product space $H$.")
-        formatter = DefinitionFormatter(llm_client=mock_llm)
+        mock_llm.response = "The **Hilbert space** is a complete inner product space $H$."
 
         raw_data = RawConceptData(
             name="Hilbert Space",
@@ -160,11 +157,8 @@ class TestDefinitionFormatter:
         assert "Hilbert Space" in mock_llm.calls[0]
         assert "## Hilbert Space" in result
 
-    def test_format_batch(self):
+    def test_format_batch(self, formatter):
         """Test batch formatting."""
-        mock_llm = MockLLMClient()
-        formatter = DefinitionFormatter(llm_client=mock_llm)
-
         raw_data_list = [
             RawConceptData(name="Set", domain="MATH", definition="A $\\{x\\}$ collection"),
             RawConceptData(name="Function", domain="MATH", definition="A map $f: A \\to B$"),
@@ -0,0 +1,282 @@
+"""Tests for the database initialization script."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from generator.seeds import DOMAIN_SEEDS, AxiomSeed, _model
+from scripts import init_db
+
+
+class FakeAsyncClient:
+    """Async Neo4j client stand-in that records every query it is sent."""
+
+    def __init__(self):
+        self.calls: list[tuple[str, dict | None]] = []
+
+    async def execute_query(self, query: str, parameters: dict | None = None):
+        self.calls.append((query, parameters))
+        return []
+
+
+@pytest.fixture
+def stub_definitions(monkeypatch):
+    """Give test seeds, which have no Markdown files, a placeholder body."""
+    monkeypatch.setattr(_model, "_read_definition", lambda domain, name: "Body")
+
+
+def _seed(name: str, *prerequisites: str) -> AxiomSeed:
+    return AxiomSeed(
+        name=name,
+        domain="MATH",
+        subfield="test",
+        complexity_level=0,
+        is_axiom=not prerequisites,
+        books=(),
+        prerequisites=prerequisites,
+    )
+
+
+class FakeWriter:
+    """Stream writer stand-in for a successful TCP probe."""
+
+    def close(self):
+        pass
+
+    async def wait_closed(self):
+        pass
+
+
+class ProbeClient(FakeAsyncClient):
+    """Client stand-in that exposes a URI and counts connect() calls."""
+
+    def __init__(self, uri: str):
+        super().__init__()
+        self.uri = uri
+        self.connects = 0
+
+    def connect(self):
+        self.connects += 1
+
+
+@pytest.fixture
+def probe(monkeypatch):
+    """Fake the Bolt port probe and record addresses, timeouts and sleeps.
+
+    Set ``failures`` on the returned namespace to refuse that many
+    connection attempts before accepting one.
+    """
+    state = SimpleNamespace(failures=0, addresses=[], timeouts=[], sleeps=[])
+    wait_for = asyncio.wait_for
+
+    async def open_connection(host, port):
+        state.addresses.append((host, port))
+        if len(state.addresses) <= state.failures:
+            raise ConnectionRefusedError("refused")
+        return None, FakeWriter()
+
+    async def recording_wait_for(aw, timeout):
+        state.timeouts.append(timeout)
+        return await wait_for(aw, timeout)
+
+    async def sleep(delay):
+        state.sleeps.append(delay)
+
+    monkeypatch.setattr(init_db.asyncio, "open_connection", open_connection)
+    monkeypatch.setattr(init_db.asyncio, "wait_for", recording_wait_for)
+    monkeypatch.setattr(init_db.asyncio, "sleep", sleep)
+    return state
+
+
+class TestWaitForNeo4j:
+    """Tests for waiting on the Bolt port before using the driver."""
+
+    @pytest.mark.asyncio
+    async def test_available_immediately(self, probe):
+        """A successful probe connects, runs a query and returns True."""
+        client = ProbeClient("bolt://db.example:7688")
+
+        assert await init_db.wait_for_neo4j(client) is True
+
+        assert probe.addresses == [("db.example", 7688)]
+        assert probe.timeouts == [0.2]
+        assert probe.sleeps == []
+        assert client.connects == 1
+        assert client.calls == [("RETURN 1", None)]
+
+    @pytest.mark.asyncio
+    async def test_default_port(self, probe):
+        """A URI without a port probes the default Bolt port."""
+        await init_db.wait_for_neo4j(ProbeClient("bolt://db.example"))
+
+        assert probe.addresses == [("db.example", 7687)]
+
+    @pytest.mark.asyncio
+    async def test_backoff_doubles_up_to_cap(self, probe):
+        """Delays double from 0.1s and stop growing at 2.0s."""
+        probe.failures = 7
+        client = ProbeClient("bolt://localhost:7687")
+
+        assert await init_db.wait_for_neo4j(client) is True
+
+        assert probe.sleeps == pytest.approx([0.1, 0.2, 0.4, 0.8, 1.6, 2.0, 2.0])
+        assert len(probe.addresses) == 8
+        assert client.connects == 1
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self, probe):
+        """Returns False once every attempt has failed, without a final sleep."""
+        probe.failures = 3
+        client = ProbeClient("bolt://localhost:7687")
+
+        assert await init_db.wait_for_neo4j(client, max_retries=3) is False
+
+        assert len(probe.addresses) == 3
+        assert probe.sleeps == pytest.approx([0.1, 0.2])
+        assert client.connects == 0
+        assert client.calls == []
+
+
+class TestLoadDomain:
+    """Tests for writing one domain's seeds."""
+
+    @pytest.mark.asyncio
+    async def test_nodes_then_edges(self):
+        """Nodes go out in one query before the edges that need them."""
+        client = FakeAsyncClient()
+
+        count = await init_db._load_domain(client, "MATH")
+
+        assert count == len(DOMAIN_SEEDS["MATH"])
+        assert [query for query, _ in client.calls] == [
+            init_db.SEED_NODES_QUERY,
+            init_db.SEED_EDGES_QUERY,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_nodes_in_topological_order(self, stub_definitions):
+        """Every concept is sent after all of its prerequisites."""
+        seeds = (_seed("C", "B"), _seed("A"), _seed("B", "A"))
+        client = FakeAsyncClient()
+
+        with patch.object(init_db, "DOMAIN_SEEDS", {"MATH": seeds}):
+            await init_db._load_domain(client, "MATH")
+
+        rows = client.calls[0][1]["rows"]
+        assert [row["name"] for row in rows] == ["A", "B", "C"]
+
+    @pytest.mark.asyncio
+    async def test_edges_use_concept_ids(self, stub_definitions):
+        """Edges pair each concept's id with its prerequisite's id."""
+        seeds = (_seed("A"), _seed("B", "A"), _seed("C", "A", "B"))
+        ids = {seed.name: seed.to_concept()["id"] for seed in seeds}
+        client = FakeAsyncClient()
+
+        with patch.object(init_db, "DOMAIN_SEEDS", {"MATH": seeds}):
+            await init_db._load_domain(client, "MATH")
+
+        edges = client.calls[1][1]["edges"]
+        assert sorted(
+            (edge["concept_id"], edge["prerequisite_id"]) for edge in edges
+        ) == sorted([
+            (ids["B"], ids["A"]),
+            (ids["C"], ids["A"]),
+            (ids["C"], ids["B"]),
+        ])
+
+    @pytest.mark.asyncio
+    async def test_cycle_raises_before_writing(self):
+        """A cyclic prerequisite graph is rejected before any query."""
+        seeds = (_seed("A", "B"), _seed("B", "A"))
+        client = FakeAsyncClient()
+
+        with patch.object(init_db, "DOMAIN_SEEDS", {"MATH": seeds}):
+            with pytest.raises(ValueError, match="cycle"):
+                await init_db._load_domain(client, "MATH")
+
+        assert client.calls == []
+
+
+class TestLoadSeeds:
+    """Tests for writing every domain's seeds."""
+
+    @pytest.mark.asyncio
+    async def test_loads_every_domain(self):
+        """Each domain sends its nodes and edges, and the counts add up."""
+        client = FakeAsyncClient()
+
+        total = await init_db.load_seeds(client)
+
+        assert total == sum(len(seeds) for seeds in DOMAIN_SEEDS.values())
+        node_queries = [p for q, p in client.calls if q == init_db.SEED_NODES_QUERY]
+        assert {rows["rows"][0]["domain"] for rows in node_queries} == set(DOMAIN_SEEDS)
+        assert len(client.calls) == 2 * len(DOMAIN_SEEDS)
+
+        # Domains interleave, but each sends its nodes before its edges
+        for domain in DOMAIN_SEEDS:
+            prefix = f"{domain.lower()}-seed-"
+            nodes_at = next(
+                i for i, (q, p) in enumerate(client.calls)
+                if q == init_db.SEED_NODES_QUERY and p["rows"][0]["id"].startswith(prefix)
+            )
+            edges_at = [
+                i for i, (q, p) in enumerate(client.calls)
+                if q == init_db.SEED_EDGES_QUERY
+                and any(e["concept_id"].startswith(prefix) for e in p["edges"])
+            ]
+            assert all(nodes_at < i for i in edges_at)
+
+
+    @pytest.mark.asyncio
+    async def test_failure_waits_for_other_domains(self):
+        """A failing domain is raised only after the others finish."""
+        failing, *others = DOMAIN_SEEDS
+        finished = []
+
+        class PartlyFailingClient(FakeAsyncClient):
+            async def execute_query(self, query, parameters=None):
+                domain = (parameters.get("rows") or [{}])[0].get("domain")
+                if domain == failing:
+                    raise RuntimeError("write failed")
+                await asyncio.sleep(0)
+                if query == init_db.SEED_EDGES_QUERY:
+                    finished.append(parameters)
+                return await super().execute_query(query, parameters)
+
+        with pytest.raises(RuntimeError, match="write failed"):
+            await init_db.load_seeds(PartlyFailingClient())
+
+        assert len(finished) == len(others)
+
+
+class TestMain:
+    """Tests for the script entry point."""
+
+    @pytest.mark.asyncio
+    async def test_closes_client_on_failure(self, monkeypatch):
+        """The client is closed even when schema setup fails."""
+
+        class FailingClient(FakeAsyncClient):
+            closed = False
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc_info):
+                FailingClient.closed = True
+
+            async def init_schema(self):
+                raise RuntimeError("schema failed")
+
+        async def available(client):
+            return True
+
+        monkeypatch.setattr(init_db, "AsyncNeo4jClient", FailingClient)
+        monkeypatch.setattr(init_db, "wait_for_neo4j", available)
+
+        with pytest.raises(RuntimeError, match="schema failed"):
+            await init_db.main()
+
+        assert FailingClient.closed
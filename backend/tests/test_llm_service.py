@@ -1,11 +1,50 @@
 """Tests for LLM service."""
 
-import json
+import asyncio
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
 
 from app.services.llm_service import LLMService, LLMResponse, get_llm_service
 
+from .stubs import async_return
+
+# opencode --format json output: one JSON event per line
+_MOCK_STDOUT = (
+    b'{"type": "step_start", "timestamp": 1}\n'
+    b'{"type": "text", "part": {"text": "Hello, "}}\n'
+    b'{"type": "text", "part": {"text": "world!"}}\n'
+    b'{"type": "step_finish", "part": {"tokens": {"input": 100, "output": 50}}}'
+)
+_MOCK_STDOUT_NO_TEXT = b'{"type": "step_start", "timestamp": 1}'
+_EXPECTED = LLMResponse(text="Hello, world!", input_tokens=100, output_tokens=50)
+
+
+@pytest.fixture
+def mock_subprocess(monkeypatch):
+    """Replace asyncio.create_subprocess_exec with a canned process.
+
+    Returns a setter taking ``(stdout, stderr, rc)`` that installs the fake
+    and returns the process it hands out; the arguments the process was
+    launched with are recorded on its ``exec_args``.
+    """
+
+    def _set(stdout, stderr=b"", rc=0):
+        proc = SimpleNamespace(
+            returncode=rc,
+            communicate=async_return((stdout, stderr)),
+            exec_args=None,
+        )
+
+        async def _exec(*args, **kwargs):
+            proc.exec_args = args
+            return proc
+
+        monkeypatch.setattr(asyncio, "create_subprocess_exec", _exec)
+        return proc
+
+    return _set
+
 
 class TestLLMService:
     """Tests for LLMService."""
@@ -21,58 +60,53 @@ class TestLLMService:
         assert service.model == "opencode/gpt-5"
 
     @pytest.mark.asyncio
-    async def test_generate_success(self):
+    async def test_generate_success(self, monkeypatch):
         """Test successful generation."""
         service = LLMService()
 
-        mock_stdout = "\n".join([
-            json.dumps({"type": "step_start", "timestamp": 1}),
-            json.dumps({"type": "text", "part": {"text": "Hello, "}}),
-            json.dumps({"type": "text", "part": {"text": "world!"}}),
-            json.dumps({
-                "type": "step_finish",
-                "part": {"tokens": {"input": 100, "output": 50}}
-            }),
-        ]).encode()
+        run = async_return((_MOCK_STDOUT, b"", 0))
+        monkeypatch.setattr(LLMService, "_run_opencode", run)
 
-        mock_process = AsyncMock()
-        mock_process.returncode = 0
-        mock_process.communicate = AsyncMock(return_value=(mock_stdout, b""))
+        result = await service.generate("Test prompt")
 
-        with patch("asyncio.create_subprocess_exec", return_value=mock_process):
-            result = await service.generate("Test prompt")
-
-            assert result.text == "Hello, world!"
-            assert result.input_tokens == 100
-            assert result.output_tokens == 50
+        assert result == _EXPECTED
 
     @pytest.mark.asyncio
-    async def test_generate_failure(self):
+    async def test_generate_failure(self, monkeypatch):
         """Test generation failure."""
         service = LLMService()
 
-        mock_process = AsyncMock()
-        mock_process.returncode = 1
-        mock_process.communicate = AsyncMock(return_value=(b"", b"Error message"))
+        run = async_return((b"", b"Error message", 1))
+        monkeypatch.setattr(LLMService, "_run_opencode", run)
 
-        with patch("asyncio.create_subprocess_exec", return_value=mock_process):
-            with pytest.raises(RuntimeError, match="opencode failed"):
-                await service.generate("Test prompt")
+        with pytest.raises(RuntimeError, match="opencode failed"):
+            await service.generate("Test prompt")
 
     @pytest.mark.asyncio
-    async def test_generate_no_text(self):
+    async def test_generate_no_text(self, monkeypatch):
         """Test generation with no text response."""
         service = LLMService()
 
-        mock_stdout = json.dumps({"type": "step_start", "timestamp": 1}).encode()
+        run = async_return((_MOCK_STDOUT_NO_TEXT, b"", 0))
+        monkeypatch.setattr(LLMService, "_run_opencode", run)
+
+        with pytest.raises(RuntimeError, match="No text response"):
+            await service.generate("Test prompt")
+
+    @pytest.mark.slow
+    @pytest.mark.asyncio
+    async def test_run_opencode(self, mock_subprocess):
+        """Test that opencode is invoked with the model and prompt."""
+        service = LLMService()
+        proc = mock_subprocess(b"out", b"err")
 
-        mock_process = AsyncMock()
-        mock_process.returncode = 0
-        mock_process.communicate = AsyncMock(return_value=(mock_stdout, b""))
+        result = await service._run_opencode("Test prompt")
 
-        with patch("asyncio.create_subprocess_exec", return_value=mock_process):
-            with pytest.raises(RuntimeError, match="No text response"):
-                await service.generate("Test prompt")
+        assert result == (b"out", b"err", 0)
+        args = proc.exec_args
+        assert args[0] == service._opencode_path
+        assert args[-1] == "Test prompt"
+        assert service.model in args
 
     def test_llm_response_dataclass(self):
         """Test LLMResponse dataclass."""
@@ -3,42 +3,52 @@
 import json
 import pytest
 from unittest.mock import AsyncMock, patch
-from fastapi.testclient import TestClient
 
-from app.main import app
+from app.services import mvg_service
 from app.services.mvg_service import MVGResult, MVGNode
 
+from .stubs import async_raise, async_return
+
+_MOCK_MVG_RESULT = MVGResult(
+    target="Derivative",
+    domain="MATH",
+    path=[
+        MVGNode(name="Set", description="A collection", is_axiom=True),
+        MVGNode(name="Limit", description="Approaching value", is_axiom=False),
+        MVGNode(name="Derivative", description="Rate of change", is_axiom=False),
+    ],
+    explanation="Minimal path to understand derivatives.",
+)
+
+# Failing generate() stubs, built once rather than per test
+_raise_parse = async_raise(ValueError, "Failed to parse LLM response")
+_raise_opencode = async_raise(RuntimeError, "opencode failed")
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    """Create a test client shared by all API tests."""
+    from fastapi.testclient import TestClient
 
-@pytest.fixture
-def client():
-    """Create a test client."""
     # Disable Neo4j initialization for tests
     with patch("app.main.get_client"):
         yield TestClient(app)
 
 
+@pytest.fixture(autouse=True)
+def reset_mvg_service(monkeypatch):
+    """Keep the MVG service singleton from leaking between tests."""
+    monkeypatch.setattr(mvg_service, "_mvg_service", None)
+
+
 class TestMVGAPI:
     """Tests for MVG API endpoints."""
 
-    @pytest.fixture
-    def mock_mvg_result(self):
-        """Create a mock MVG result."""
-        return MVGResult(
-            target="Derivative",
-            domain="MATH",
-            path=[
-                MVGNode(name="Set", description="A collection", is_axiom=True),
-                MVGNode(name="Limit", description="Approaching value", is_axiom=False),
-                MVGNode(name="Derivative", description="Rate of change", is_axiom=False),
-            ],
-            explanation="Minimal path to understand derivatives.",
-        )
-
-    def test_generate_mvg_success(self, client, mock_mvg_result):
+    def test_generate_mvg_success(self, client):
         """Test successful MVG generation."""
         with patch("app.api.routes.mvg.get_mvg_service") as mock_service:
             mock_instance = mock_service.return_value
-            mock_instance.generate = AsyncMock(return_value=mock_mvg_result)
+            mock_instance.generate = async_return(_MOCK_MVG_RESULT)
 
             response = client.post(
                 "/api/mvg/generate",
@@ -54,11 +64,11 @@ class TestMVGAPI:
             assert data["path"][0]["is_axiom"] is True
             assert "explanation" in data
 
-    def test_generate_mvg_default_domain(self, client, mock_mvg_result):
+    def test_generate_mvg_default_domain(self, client):
         """Test MVG generation with default domain."""
         with patch("app.api.routes.mvg.get_mvg_service") as mock_service:
             mock_instance = mock_service.return_value
-            mock_instance.generate = AsyncMock(return_value=mock_mvg_result)
+            mock_instance.generate = AsyncMock(return_value=_MOCK_MVG_RESULT)
 
             response = client.post(
                 "/api/mvg/generate",
@@ -75,9 +85,7 @@ class TestMVGAPI:
         """Test MVG generation with parse error."""
         with patch("app.api.routes.mvg.get_mvg_service") as mock_service:
             mock_instance = mock_service.return_value
-            mock_instance.generate = AsyncMock(
-                side_effect=ValueError("Failed to parse LLM response")
-            )
+            mock_instance.generate = _raise_parse
 
             response = client.post(
                 "/api/mvg/generate",
@@ -91,9 +99,7 @@ class TestMVGAPI:
         """Test MVG generation with LLM service error."""
         with patch("app.api.routes.mvg.get_mvg_service") as mock_service:
             mock_instance = mock_service.return_value
-            mock_instance.generate = AsyncMock(
-                side_effect=RuntimeError("opencode failed")
-            )
+            mock_instance.generate = _raise_opencode
 
             response = client.post(
                 "/api/mvg/generate",
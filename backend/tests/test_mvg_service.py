@@ -2,11 +2,30 @@
 
 import json
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
 
 from app.services.llm_service import LLMResponse
 from app.services.mvg_service import MVGService, MVGNode, MVGResult
 
+from .stubs import async_raise, async_return
+
+# LLM completions are encoded once at import rather than in every fixture call
+_MVG_JSON = json.dumps({
+    "path": [
+        {"name": "Set", "description": "A collection of objects", "is_axiom": True},
+        {"name": "Function", "description": "A mapping between sets", "is_axiom": False},
+        {"name": "Limit", "description": "The value a function approaches", "is_axiom": False},
+        {"name": "Derivative", "description": "Rate of change", "is_axiom": False},
+    ],
+    "explanation": "This is the minimal path from set theory axioms to derivatives."
+})
+_MVG_JSON_SHORT = json.dumps({
+    "path": [
+        {"name": "Set", "description": "A collection", "is_axiom": True},
+    ],
+    "explanation": "Minimal path."
+})
+_MVG_JSON_CODEBLOCK = f"```json\n{_MVG_JSON_SHORT}\n```"
+
 
 class TestMVGService:
     """Tests for MVGService."""
@@ -14,97 +33,89 @@ class TestMVGService:
     @pytest.fixture
     def mock_llm_response(self):
         """Create a mock LLM response."""
-        return LLMResponse(
-            text=json.dumps({
-                "path": [
-                    {"name": "Set", "description": "A collection of objects", "is_axiom": True},
-                    {"name": "Function", "description": "A mapping between sets", "is_axiom": False},
-                    {"name": "Limit", "description": "The value a function approaches", "is_axiom": False},
-                    {"name": "Derivative", "description": "Rate of change", "is_axiom": False},
-                ],
-                "explanation": "This is the minimal path from set theory axioms to derivatives."
-            }),
-            input_tokens=100,
-            output_tokens=50,
-        )
+        return LLMResponse(text=_MVG_JSON, input_tokens=100, output_tokens=50)
 
     @pytest.fixture
     def mock_llm_response_with_codeblock(self):
         """Create a mock LLM response with markdown code block."""
         return LLMResponse(
-            text="```json\n" + json.dumps({
-                "path": [
-                    {"name": "Set", "description": "A collection", "is_axiom": True},
-                ],
-                "explanation": "Minimal path."
-            }) + "\n```",
-            input_tokens=100,
-            output_tokens=50,
+            text=_MVG_JSON_CODEBLOCK, input_tokens=100, output_tokens=50
         )
 
+    @pytest.fixture
+    def mvg_service_with_llm(self, monkeypatch):
+        """Build an MVGService whose LLM returns (or raises) a canned result.
+
+        Returns a setter taking an LLMResponse or an exception class; the
+        patched generate() is restored at teardown.
+        """
+
+        def _set(result):
+            service = MVGService()
+            if isinstance(result, type) and issubclass(result, BaseException):
+                stub = async_raise(result)
+            else:
+                stub = async_return(result)
+            monkeypatch.setattr(service._llm, "generate", stub)
+            return service
+
+        return _set
+
     @pytest.mark.asyncio
-    async def test_generate_basic(self, mock_llm_response):
+    async def test_generate_basic(self, mvg_service_with_llm, mock_llm_response):
         """Test basic MVG generation."""
-        service = MVGService()
+        service = mvg_service_with_llm(mock_llm_response)
 
-        with patch.object(service._llm, 'generate', new_callable=AsyncMock) as mock_generate:
-            mock_generate.return_value = mock_llm_response
+        result = await service.generate("Derivative", "MATH")
 
-            result = await service.generate("Derivative", "MATH")
-
-            assert result.target == "Derivative"
-            assert result.domain == "MATH"
-            assert len(result.path) == 4
-            assert result.path[0].name == "Set"
-            assert result.path[0].is_axiom is True
-            assert result.path[3].name == "Derivative"
-            assert "minimal path" in result.explanation.lower()
+        assert result.target == "Derivative"
+        assert result.domain == "MATH"
+        assert len(result.path) == 4
+        assert result.path[0].name == "Set"
+        assert result.path[0].is_axiom is True
+        assert result.path[3].name == "Derivative"
+        assert "minimal path" in result.explanation.lower()
 
     @pytest.mark.asyncio
-    async def test_generate_handles_codeblock(self, mock_llm_response_with_codeblock):
+    async def test_generate_handles_codeblock(self, mvg_service_with_llm, mock_llm_response_with_codeblock):
         """Test that MVG generation handles markdown code blocks."""
-        service = MVGService()
-
-        with patch.object(service._llm, 'generate', new_callable=AsyncMock) as mock_generate:
-            mock_generate.return_value = mock_llm_response_with_codeblock
+        service = mvg_service_with_llm(mock_llm_response_with_codeblock)
 
-            result = await service.generate("Set", "MATH")
+        result = await service.generate("Set", "MATH")
 
-            assert result.target == "Set"
-            assert len(result.path) == 1
-            assert result.path[0].name == "Set"
+        assert result.target == "Set"
+        assert len(result.path) == 1
+        assert result.path[0].name == "Set"
 
     @pytest.mark.asyncio
-    async def test_generate_invalid_json(self):
+    async def test_generate_invalid_json(self, mvg_service_with_llm):
         """Test that invalid JSON raises ValueError."""
-        service = MVGService()
+        response = LLMResponse(
+            text="This is not JSON",
+            input_tokens=10,
+            output_tokens=5,
+        )
 
-        with patch.object(service._llm, 'generate', new_callable=AsyncMock) as mock_generate:
-            mock_generate.return_value = LLMResponse(
-                text="This is not JSON",
-                input_tokens=10,
-                output_tokens=5,
-            )
+        service = mvg_service_with_llm(response)
 
-            with pytest.raises(ValueError, match="Failed to parse"):
-                await service.generate("Test", "MATH")
+        with pytest.raises(ValueError, match="Failed to parse"):
+            await service.generate("Test", "MATH")
 
     @pytest.mark.asyncio
-    async def test_generate_empty_path(self):
+    async def test_generate_empty_path(self, mvg_service_with_llm):
         """Test handling of empty path in response."""
-        service = MVGService()
+        response = LLMResponse(
+            text=json.dumps({"path": [], "explanation": "Empty"}),
+            input_tokens=10,
+            output_tokens=5,
+        )
 
-        with patch.object(service._llm, 'generate', new_callable=AsyncMock) as mock_generate:
-            mock_generate.return_value = LLMResponse(
-                text=json.dumps({"path": [], "explanation": "Empty"}),
-                input_tokens=10,
-                output_tokens=5,
-            )
+        service = mvg_service_with_llm(response)
 
-            result = await service.generate("Test", "MATH")
+        result = await service.generate("Test", "MATH")
 
-            assert result.path == []
-            assert result.explanation == "Empty"
+        assert result.path == []
+        assert result.explanation == "Empty"
 
     def test_mvg_node_dataclass(self):
         """Test MVGNode dataclass."""
@@ -0,0 +1,85 @@
+"""Tests for the async Neo4j client."""
+
+import asyncio
+
+import pytest
+
+from app.db import neo4j_client
+from app.db.neo4j_client import SCHEMA_QUERIES, AsyncNeo4jClient
+
+
+class FakeDriver:
+    """Async driver stand-in that records whether it was closed."""
+
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def drivers(monkeypatch):
+    """Replace driver creation with FakeDriver and collect every instance."""
+    created: list[FakeDriver] = []
+
+    def _driver(uri, auth):
+        created.append(FakeDriver())
+        return created[-1]
+
+    monkeypatch.setattr(neo4j_client.AsyncGraphDatabase, "driver", _driver)
+    return created
+
+
+class TestAsyncNeo4jClient:
+    """Tests for AsyncNeo4jClient lifecycle and schema setup."""
+
+    def test_connect_reuses_driver(self, drivers):
+        """Repeated connect() calls share one driver."""
+        client = AsyncNeo4jClient()
+
+        client.connect()
+        client.connect()
+
+        assert len(drivers) == 1
+
+    @pytest.mark.asyncio
+    async def test_context_closes_driver_on_error(self, drivers):
+        """Leaving the async context closes the driver, even on failure."""
+        with pytest.raises(RuntimeError):
+            async with AsyncNeo4jClient():
+                raise RuntimeError("boom")
+
+        assert drivers[0].closed
+
+    @pytest.mark.asyncio
+    async def test_close_allows_reconnect(self, drivers):
+        """A closed client creates a fresh driver on the next connect()."""
+        client = AsyncNeo4jClient()
+        client.connect()
+        await client.close()
+
+        client.connect()
+
+        assert len(drivers) == 2
+        assert drivers[0].closed and not drivers[1].closed
+
+    @pytest.mark.asyncio
+    async def test_init_schema_awaits_every_statement(self, monkeypatch):
+        """A failing statement is raised only after the others finish."""
+        client = AsyncNeo4jClient()
+        finished = []
+
+        async def execute_query(query, parameters=None):
+            if query == SCHEMA_QUERIES[0]:
+                raise RuntimeError("constraint failed")
+            await asyncio.sleep(0)
+            finished.append(query)
+            return []
+
+        monkeypatch.setattr(client, "execute_query", execute_query)
+
+        with pytest.raises(RuntimeError, match="constraint failed"):
+            await client.init_schema()
+
+        assert finished == SCHEMA_QUERIES[1:]
@@ -1,65 +1,83 @@
 """Tests for forward pass, backward pass, and orchestrator engines."""
 
 import pytest
-from unittest.mock import Mock, patch
+from collections import defaultdict
+from unittest.mock import Mock
 from dataclasses import dataclass
 
 from generator.core.forward_pass import ForwardPassEngine, ForwardPassResult
 from generator.core.backward_pass import BackwardPassEngine, BackwardPassResult
 from generator.core.orchestrator import Orchestrator, OrchestratorConfig, GenerationResult
 
+# Engine mocks built once; tests reset their call history before use
+_FWD_MOCK = Mock(
+    return_value=ForwardPassResult(concepts_added=1, concepts_skipped=0, errors=[])
+)
+_BWD_MOCK = Mock(
+    return_value=BackwardPassResult(
+        concepts_added=1, concepts_skipped=0, prerequisites_linked=1, errors=[]
+    )
+)
+
 
 class MockConceptStore:
-    """Mock implementation of ConceptStore for testing."""
+    """Mock implementation of ConceptStore for testing.
+
+    Concepts are indexed by name and domain as they are created, so the
+    lookups the engines make during execute() avoid scanning every concept.
+    """
 
     def __init__(self):
         self.concepts: dict[str, dict] = {}
         self.requires: list[tuple[str, str]] = []
+        self._by_name: dict[str, dict] = {}
+        self._by_domain: defaultdict[str, list[dict]] = defaultdict(list)
+        self._axioms: defaultdict[str, list[dict]] = defaultdict(list)
+        self._has_prereqs: set[str] = set()
+
+    def clear(self) -> None:
+        """Remove all concepts and relationships."""
+        self.__init__()
 
     def get_by_name(self, name: str) -> dict | None:
-        for c in self.concepts.values():
-            if c["name"] == name:
-                return c
-        return None
+        return self._by_name.get(name)
 
     def get_axioms(self, domain: str) -> list[dict]:
-        return [
-            c for c in self.concepts.values()
-            if c.get("is_axiom") and c.get("domain") == domain
-        ]
+        return list(self._axioms.get(domain, ()))
 
     def get_by_complexity_range(
         self, domain: str, min_level: int, max_level: int
     ) -> list[dict]:
         return [
-            c for c in self.concepts.values()
-            if c.get("domain") == domain
-            and min_level <= c.get("complexity_level", 0) <= max_level
+            c for c in self._by_domain.get(domain, ())
+            if min_level <= c.get("complexity_level", 0) <= max_level
         ]
 
     def get_complex_concepts(self, domain: str, min_level: int) -> list[dict]:
         return [
-            c for c in self.concepts.values()
-            if c.get("domain") == domain
-            and c.get("complexity_level", 0) >= min_level
+            c for c in self._by_domain.get(domain, ())
+            if c.get("complexity_level", 0) >= min_level
         ]
 
     def get_incomplete_concepts(self, domain: str) -> list[dict]:
         # Return concepts that have no requires relationships
-        has_prereqs = {r[0] for r in self.requires}
         return [
-            c for c in self.concepts.values()
-            if c.get("domain") == domain
-            and c["id"] not in has_prereqs
-            and not c.get("is_axiom")
+            c for c in self._by_domain.get(domain, ())
+            if c["id"] not in self._has_prereqs and not c.get("is_axiom")
         ]
 
     def create(self, concept: dict) -> dict:
         self.concepts[concept["id"]] = concept
+        self._by_name.setdefault(concept["name"], concept)
+        domain = concept.get("domain")
+        self._by_domain[domain].append(concept)
+        if concept.get("is_axiom"):
+            self._axioms[domain].append(concept)
         return concept
 
     def add_requires(self, concept_id: str, prerequisite_id: str) -> None:
         self.requires.append((concept_id, prerequisite_id))
+        self._has_prereqs.add(concept_id)
 
     def update_prerequisites(self, concept_id: str, prereq_names: list[str]) -> None:
         pass  # Not used in tests
@@ -79,12 +97,16 @@ class MockLLMClient:
         return "Test response"
 
 
+# Terms the mock Wikipedia extractor can find
+_WIKI_KNOWN = frozenset({"set", "function", "vector space", "derivative"})
+
+
 class MockWikipediaExtractor:
     """Mock Wikipedia extractor for testing."""
 
     def can_extract(self, term: str) -> bool:
         # Simulate finding some but not all terms
-        return term.lower() in {"set", "function", "vector space", "derivative"}
+        return term.lower() in _WIKI_KNOWN
 
     def extract(self, term: str, domain: str, subfield: str):
         from generator.extractors import ExtractedConcept
@@ -107,79 +129,138 @@ class MockResourceExtractor:
         return concept
 
 
-@pytest.fixture
-def mock_store():
-    """Create a mock store with seed data."""
+# Concept payloads, built once; the store and engines never modify them.
+# Axioms
+_AXIOM_EXTENSIONALITY = {
+    "id": "math-set_theory-extensionality-001",
+    "name": "Axiom of Extensionality",
+    "definition_md": "## Axiom of Extensionality\n\nTwo sets are equal iff they have the same elements.",
+    "domain": "MATH",
+    "subfield": "set_theory",
+    "complexity_level": 0,
+    "is_axiom": True,
+    "books": [],
+    "papers": [],
+    "articles": [],
+    "related_concepts": ["Set", "Function"],
+    "llm_summary": "",
+    "is_verified": False,
+}
+
+_AXIOM_EMPTY_SET = {
+    "id": "math-set_theory-empty-set-002",
+    "name": "Axiom of Empty Set",
+    "definition_md": "## Axiom of Empty Set\n\nThere exists a set with no elements.",
+    "domain": "MATH",
+    "subfield": "set_theory",
+    "complexity_level": 0,
+    "is_axiom": True,
+    "books": [],
+    "papers": [],
+    "articles": [],
+    "related_concepts": [],
+    "llm_summary": "",
+    "is_verified": False,
+}
+
+# A complex concept for backward pass testing
+_VECTOR_SPACE = {
+    "id": "math-linear_algebra-vector-space-003",
+    "name": "Vector Space",
+    "definition_md": "## Vector Space\n\nA **vector space** requires understanding of **Set** and **Field**.",
+    "domain": "MATH",
+    "subfield": "linear_algebra",
+    "complexity_level": 3,
+    "is_axiom": False,
+    "books": [],
+    "papers": [],
+    "articles": [],
+    "related_concepts": [],
+    "llm_summary": "",
+    "is_verified": False,
+}
+
+# A non-axiom concept that the passes would otherwise create
+_SET = {
+    "id": "math-set_theory-set-existing",
+    "name": "Set",
+    "definition_md": "## Set\n\nA collection of elements.",
+    "domain": "MATH",
+    "subfield": "set_theory",
+    "complexity_level": 1,
+    "is_axiom": False,
+    "books": [],
+    "papers": [],
+    "articles": [],
+    "related_concepts": [],
+    "llm_summary": "",
+    "is_verified": False,
+}
+
+
+@pytest.fixture(scope="module")
+def seed_store():
+    """Create a mock store with seed data, shared by the whole module."""
     store = MockConceptStore()
-
-    # Add some axioms
-    store.create({
-        "id": "math-set_theory-extensionality-001",
-        "name": "Axiom of Extensionality",
-        "definition_md": "## Axiom of Extensionality\n\nTwo sets are equal iff they have the same elements.",
-        "domain": "MATH",
-        "subfield": "set_theory",
-        "complexity_level": 0,
-        "is_axiom": True,
-        "books": [],
-        "papers": [],
-        "articles": [],
-        "related_concepts": ["Set", "Function"],
-        "llm_summary": "",
-        "is_verified": False,
-    })
-
-    store.create({
-        "id": "math-set_theory-empty-set-002",
-        "name": "Axiom of Empty Set",
-        "definition_md": "## Axiom of Empty Set\n\nThere exists a set with no elements.",
-        "domain": "MATH",
-        "subfield": "set_theory",
-        "complexity_level": 0,
-        "is_axiom": True,
-        "books": [],
-        "papers": [],
-        "articles": [],
-        "related_concepts": [],
-        "llm_summary": "",
-        "is_verified": False,
-    })
-
-    # Add a complex concept for backward pass testing
-    store.create({
-        "id": "math-linear_algebra-vector-space-003",
-        "name": "Vector Space",
-        "definition_md": "## Vector Space\n\nA **vector space** requires understanding of **Set** and **Field**.",
-        "domain": "MATH",
-        "subfield": "linear_algebra",
-        "complexity_level": 3,
-        "is_axiom": False,
-        "books": [],
-        "papers": [],
-        "articles": [],
-        "related_concepts": [],
-        "llm_summary": "",
-        "is_verified": False,
-    })
-
+    for concept in (_AXIOM_EXTENSIONALITY, _AXIOM_EMPTY_SET, _VECTOR_SPACE):
+        store.create(dict(concept))
     return store
 
 
 @pytest.fixture
+def mock_store(seed_store):
+    """The shared seed store, reset to its seed data after each test.
+
+    Engines only add concepts and edges and never modify existing concept
+    dicts, so replaying the seed concepts and edges restores it.
+    """
+    concepts = list(seed_store.concepts.values())
+    requires = list(seed_store.requires)
+    yield seed_store
+    seed_store.clear()
+    for concept in concepts:
+        seed_store.create(concept)
+    for concept_id, prerequisite_id in requires:
+        seed_store.add_requires(concept_id, prerequisite_id)
+
+
+@pytest.fixture(scope="session")
 def mock_llm():
     return MockLLMClient()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_wikipedia():
     return MockWikipediaExtractor()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_resources():
     return MockResourceExtractor()
 
 
+@pytest.fixture(scope="module")
+def forward_engine(seed_store, mock_llm, mock_wikipedia, mock_resources):
+    """Forward pass engine shared by tests of its read-only helpers."""
+    return ForwardPassEngine(
+        store=seed_store,
+        llm_client=mock_llm,
+        wikipedia=mock_wikipedia,
+        resource_extractor=mock_resources,
+    )
+
+
+@pytest.fixture(scope="module")
+def backward_engine(seed_store, mock_llm, mock_wikipedia, mock_resources):
+    """Backward pass engine shared by tests of its read-only helpers."""
+    return BackwardPassEngine(
+        store=seed_store,
+        llm_client=mock_llm,
+        wikipedia=mock_wikipedia,
+        resource_extractor=mock_resources,
+    )
+
+
 class TestForwardPassEngine:
     """Tests for ForwardPassEngine."""
 
@@ -205,21 +286,7 @@ class TestForwardPassEngine:
     ):
         """Forward pass should skip concepts that already exist."""
         # Add a concept that would be found via related_concepts
-        mock_store.create({
-            "id": "math-set_theory-set-existing",
-            "name": "Set",
-            "definition_md": "## Set\n\nA collection of elements.",
-            "domain": "MATH",
-            "subfield": "set_theory",
-            "complexity_level": 1,
-            "is_axiom": False,
-            "books": [],
-            "papers": [],
-            "articles": [],
-            "related_concepts": [],
-            "llm_summary": "",
-            "is_verified": False,
-        })
+        mock_store.create(dict(_SET))
 
         engine = ForwardPassEngine(
             store=mock_store,
@@ -233,44 +300,32 @@ class TestForwardPassEngine:
         # "Set" should be skipped since it exists
         assert result.concepts_skipped >= 1
 
-    def test_extract_related_terms_finds_bold_terms(
-        self, mock_store, mock_llm, mock_wikipedia, mock_resources
-    ):
+    def test_extract_related_terms_finds_bold_terms(self, forward_engine):
         """Should extract bolded terms from definition."""
-        engine = ForwardPassEngine(
-            store=mock_store,
-            llm_client=mock_llm,
-            wikipedia=mock_wikipedia,
-            resource_extractor=mock_resources,
-        )
-
         concept = {
             "name": "Test Concept",
             "definition_md": "This uses **Vector Space** and **Linear Map**.",
             "related_concepts": [],
         }
 
-        terms = engine._extract_related_terms(concept)
+        terms = forward_engine._extract_related_terms(concept)
 
         assert "Vector Space" in terms
         assert "Linear Map" in terms
 
-    def test_is_likely_concept_filters_common_words(
-        self, mock_store, mock_llm, mock_wikipedia, mock_resources
-    ):
+    @pytest.mark.parametrize(
+        "term,expected",
+        [
+            ("Vector Space", True),
+            ("Set", True),
+            ("example", False),
+            ("note", False),
+            ("if", False),
+        ],
+    )
+    def test_is_likely_concept(self, forward_engine, term, expected):
         """Should filter out common words that aren't concepts."""
-        engine = ForwardPassEngine(
-            store=mock_store,
-            llm_client=mock_llm,
-            wikipedia=mock_wikipedia,
-            resource_extractor=mock_resources,
-        )
-
-        assert engine._is_likely_concept("Vector Space") is True
-        assert engine._is_likely_concept("Set") is True
-        assert engine._is_likely_concept("example") is False
-        assert engine._is_likely_concept("note") is False
-        assert engine._is_likely_concept("if") is False
+        assert forward_engine._is_likely_concept(term) is expected
 
 
 class TestBackwardPassEngine:
@@ -293,23 +348,14 @@ class TestBackwardPassEngine:
         assert result.concepts_added >= 0
         assert result.prerequisites_linked >= 0
 
-    def test_find_prerequisites_extracts_bold_terms(
-        self, mock_store, mock_llm, mock_wikipedia, mock_resources
-    ):
+    def test_find_prerequisites_extracts_bold_terms(self, backward_engine):
         """Should find prerequisite terms mentioned in definition."""
-        engine = BackwardPassEngine(
-            store=mock_store,
-            llm_client=mock_llm,
-            wikipedia=mock_wikipedia,
-            resource_extractor=mock_resources,
-        )
-
         concept = {
             "name": "Vector Space",
             "definition_md": "Requires understanding of **Set** and assumes knowledge of **Field**.",
         }
 
-        prereqs = engine._find_prerequisites(concept, "MATH")
+        prereqs = backward_engine._find_prerequisites(concept, "MATH")
 
         # Should find "Set" and possibly "Field"
         assert any("Set" in p for p in prereqs) or any("Field" in p for p in prereqs)
@@ -319,21 +365,7 @@ class TestBackwardPassEngine:
     ):
         """Should link to existing concepts rather than creating duplicates."""
         # Add a concept that is a prerequisite
-        mock_store.create({
-            "id": "math-set_theory-set-existing",
-            "name": "Set",
-            "definition_md": "## Set\n\nA collection.",
-            "domain": "MATH",
-            "subfield": "set_theory",
-            "complexity_level": 1,
-            "is_axiom": False,
-            "books": [],
-            "papers": [],
-            "articles": [],
-            "related_concepts": [],
-            "llm_summary": "",
-            "is_verified": False,
-        })
+        mock_store.create(dict(_SET))
 
         engine = BackwardPassEngine(
             store=mock_store,
@@ -355,24 +387,20 @@ class TestOrchestrator:
         self, mock_store, mock_llm, mock_wikipedia, mock_resources
     ):
         """Orchestrator should alternate between forward and backward passes."""
-        # Patch the engines to track calls
-        with patch.object(ForwardPassEngine, 'execute') as mock_forward, \
-             patch.object(BackwardPassEngine, 'execute') as mock_backward:
+        config = OrchestratorConfig(pass_ratio=0.5)
+        orchestrator = Orchestrator(mock_store, mock_llm, config)
 
-            mock_forward.return_value = ForwardPassResult(
-                concepts_added=1, concepts_skipped=0, errors=[]
-            )
-            mock_backward.return_value = BackwardPassResult(
-                concepts_added=1, concepts_skipped=0, prerequisites_linked=1, errors=[]
-            )
+        # Swap in the cached engine mocks to track calls
+        _FWD_MOCK.reset_mock()
+        _BWD_MOCK.reset_mock()
+        orchestrator.forward_engine.execute = _FWD_MOCK
+        orchestrator.backward_engine.execute = _BWD_MOCK
 
-            config = OrchestratorConfig(pass_ratio=0.5)
-            orchestrator = Orchestrator(mock_store, mock_llm, config)
-            result = orchestrator.run(target_terms=4, domains=["MATH"])
+        orchestrator.run(target_terms=4, domains=["MATH"])
 
-            # Should have called both passes
-            assert mock_forward.call_count >= 1
-            assert mock_backward.call_count >= 1
+        # Should have called both passes
+        assert _FWD_MOCK.call_count >= 1
+        assert _BWD_MOCK.call_count >= 1
 
     def test_run_respects_target_count(
         self, mock_store, mock_llm, mock_wikipedia, mock_resources
@@ -396,35 +424,33 @@ class TestOrchestrator:
         assert isinstance(result, GenerationResult)
         assert result.total_concepts_added == 10
 
-    def test_run_single_pass_forward(
-        self, mock_store, mock_llm, mock_wikipedia, mock_resources
+    @pytest.mark.parametrize(
+        "direction,engine_attr,expected",
+        [
+            (
+                "forward",
+                "forward_engine",
+                ForwardPassResult(concepts_added=3, concepts_skipped=1, errors=[]),
+            ),
+            (
+                "backward",
+                "backward_engine",
+                BackwardPassResult(
+                    concepts_added=2, concepts_skipped=0, prerequisites_linked=3, errors=[]
+                ),
+            ),
+        ],
+    )
+    def test_run_single_pass(
+        self, mock_store, mock_llm, direction, engine_attr, expected
     ):
-        """Should be able to run a single forward pass."""
+        """Should be able to run a single pass in either direction."""
         orchestrator = Orchestrator(mock_store, mock_llm)
-        orchestrator.forward_engine.execute = Mock(
-            return_value=ForwardPassResult(concepts_added=3, concepts_skipped=1, errors=[])
-        )
-
-        result = orchestrator.run_single_pass("forward", 3, ["MATH"])
-
-        assert isinstance(result, ForwardPassResult)
-        assert result.concepts_added == 3
-
-    def test_run_single_pass_backward(
-        self, mock_store, mock_llm, mock_wikipedia, mock_resources
-    ):
-        """Should be able to run a single backward pass."""
-        orchestrator = Orchestrator(mock_store, mock_llm)
-        orchestrator.backward_engine.execute = Mock(
-            return_value=BackwardPassResult(
-                concepts_added=2, concepts_skipped=0, prerequisites_linked=3, errors=[]
-            )
-        )
+        getattr(orchestrator, engine_attr).execute = Mock(return_value=expected)
 
-        result = orchestrator.run_single_pass("backward", 2, ["MATH"])
+        result = orchestrator.run_single_pass(direction, expected.concepts_added, ["MATH"])
 
-        assert isinstance(result, BackwardPassResult)
-        assert result.concepts_added == 2
+        assert result is expected
 
     def test_run_single_pass_invalid_type(self, mock_store, mock_llm):
         """Should raise error for invalid pass type."""
@@ -433,40 +459,51 @@ class TestOrchestrator:
         with pytest.raises(ValueError):
             orchestrator.run_single_pass("invalid", 1, ["MATH"])
 
-    def test_generation_result_success_property(self):
+    @pytest.mark.parametrize(
+        "result,expected",
+        [
+            # Successful generation
+            (
+                GenerationResult(
+                    total_concepts_added=50,
+                    forward_concepts=25,
+                    backward_concepts=25,
+                    total_passes=10,
+                    forward_passes=5,
+                    backward_passes=5,
+                    all_errors=[],
+                ),
+                True,
+            ),
+            # Failed generation (no concepts)
+            (
+                GenerationResult(
+                    total_concepts_added=0,
+                    forward_concepts=0,
+                    backward_concepts=0,
+                    total_passes=2,
+                    forward_passes=1,
+                    backward_passes=1,
+                    all_errors=["Error 1"],
+                ),
+                False,
+            ),
+            # Failed generation (too many errors)
+            (
+                GenerationResult(
+                    total_concepts_added=10,
+                    forward_concepts=5,
+                    backward_concepts=5,
+                    total_passes=4,
+                    forward_passes=2,
+                    backward_passes=2,
+                    all_errors=["Error"] * 25,
+                ),
+                False,
+            ),
+        ],
+        ids=["success", "no-concepts", "too-many-errors"],
+    )
+    def test_generation_result_success_property(self, result, expected):
         """GenerationResult.success should reflect generation quality."""
-        # Successful generation
-        success_result = GenerationResult(
-            total_concepts_added=50,
-            forward_concepts=25,
-            backward_concepts=25,
-            total_passes=10,
-            forward_passes=5,
-            backward_passes=5,
-            all_errors=[],
-        )
-        assert success_result.success is True
-
-        # Failed generation (no concepts)
-        failed_result = GenerationResult(
-            total_concepts_added=0,
-            forward_concepts=0,
-            backward_concepts=0,
-            total_passes=2,
-            forward_passes=1,
-            backward_passes=1,
-            all_errors=["Error 1"],
-        )
-        assert failed_result.success is False
-
-        # Failed generation (too many errors)
-        error_result = GenerationResult(
-            total_concepts_added=10,
-            forward_concepts=5,
-            backward_concepts=5,
-            total_passes=4,
-            forward_passes=2,
-            backward_passes=2,
-            all_errors=["Error"] * 25,
-        )
-        assert error_result.success is False
+        assert result.success is expected
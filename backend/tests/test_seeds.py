@@ -0,0 +1,474 @@
+"""Tests for seed definitions and their helpers."""
+
+import hashlib
+import json
+import marshal
+import textwrap
+from unittest.mock import patch
+
+import pytest
+
+from generator.seeds import DOMAIN_SEEDS, AxiomSeed, dump_seeds
+from generator.seeds import _cache, _model, _serde, mathematics
+from generator.seeds._graph import (
+    has_cycle,
+    prereq_csr,
+    topo_order,
+    transitive_closure,
+)
+from generator.seeds._loader import load_domain, load_source
+from generator.seeds._table import AXIOM_BIT, SeedTable
+from generator.seeds.mathematics import is_prereq
+
+
+class TestSerde:
+    """Tests for seed serialization."""
+
+    def test_dump_seeds_round_trips(self):
+        """Dumped seeds should decode back to the original definitions."""
+        data = json.loads(dump_seeds("MATH"))
+
+        assert len(data) == len(DOMAIN_SEEDS["MATH"])
+        assert data[0]["name"] == "Axiom of Extensionality"
+        assert data[0]["prerequisites"] == []
+
+    def test_stdlib_fallback_matches(self):
+        """The stdlib fallback should produce equivalent JSON."""
+        expected = json.loads(dump_seeds("PHYSICS"))
+
+        with patch.object(_serde, "orjson", None):
+            fallback = dump_seeds("PHYSICS")
+
+        assert isinstance(fallback, bytes)
+        assert json.loads(fallback) == expected
+
+
+class TestAxiomSeed:
+    """Tests for the AxiomSeed row type."""
+
+    def test_adds_heading_from_name(self):
+        """Seeds without a heading get one from their name."""
+        with patch.object(_model, "_read_definition", return_value="A collection of elements."):
+            assert _seed("Set").render() == "## Set\n\nA collection of elements."
+
+    def test_keeps_custom_heading(self):
+        """Headings that differ from the name are preserved."""
+        with patch.object(_model, "_read_definition", return_value="## Axiom of Choice (AC)\n\nBody"):
+            assert _seed("Axiom of Choice").render() == "## Axiom of Choice (AC)\n\nBody"
+
+    def test_slug_folds_accents(self):
+        """Accented letters map to their base letter in file names."""
+        assert _model.definition_slug("Ampère-Maxwell Law") == "ampere_maxwell_law"
+        assert _model.definition_slug("Schrödinger Equation") == "schrodinger_equation"
+
+    @pytest.mark.parametrize("domain", list(DOMAIN_SEEDS))
+    def test_definition_files_match_seeds(self, domain):
+        """Each seed has its own definition file and no file is orphaned."""
+        slugs = [_model.definition_slug(seed.name) for seed in DOMAIN_SEEDS[domain]]
+        files = {
+            entry.name.removesuffix(".md")
+            for entry in (_model.DEFINITIONS_DIR / domain.lower()).iterdir()
+            if entry.name.endswith(".md")
+        }
+
+        assert len(set(slugs)) == len(slugs)
+        assert set(slugs) == files
+
+    def test_definition_read_from_file(self):
+        """Definitions are loaded from the domain's Markdown files."""
+        seed = mathematics.MATH_AXIOM_DEFINITIONS[0]
+        path = _model.DEFINITIONS_DIR / "math" / "axiom_of_extensionality.md"
+
+        assert seed.definition_md == path.read_text(encoding="utf-8").rstrip("\n")
+        assert "definition_md" not in seed._fields
+
+    def test_to_concept(self):
+        """Seeds convert to Concept node properties with a stable id."""
+        seed = DOMAIN_SEEDS["PHYSICS"][0]
+
+        concept = seed.to_concept()
+
+        assert concept["id"] == "physics-seed-newton's-first-law"
+        assert concept["definition_md"] == seed.render()
+        assert concept["is_verified"] is True
+        assert concept["books"] == list(seed.books)
+
+    def test_rows_have_no_instance_dict(self):
+        """Seed rows store fields in tuple slots, not a per-row dict."""
+        seed = DOMAIN_SEEDS["MATH"][0]
+
+        assert not hasattr(seed, "__dict__")
+        assert seed.name == seed[0]
+
+    def test_shared_strings_are_interned(self):
+        """Equal names across seeds share a single string object."""
+        defs = mathematics.MATH_AXIOM_DEFINITIONS
+        names = {seed.name: seed.name for seed in defs}
+
+        for seed in defs:
+            for prereq in seed.prerequisites:
+                assert prereq is names[prereq]
+
+    def test_equal_tuples_are_shared(self):
+        """Seeds with the same bibliography share one books tuple."""
+        defs = mathematics.MATH_AXIOM_DEFINITIONS
+        by_books = {seed.books: seed.books for seed in defs}
+
+        for seed in defs:
+            assert seed.books is by_books[seed.books]
+
+    def test_book_titles_are_interned(self):
+        """A book cited by several seeds is one string object."""
+        titles = {}
+        for seed in DOMAIN_SEEDS["PHYSICS"]:
+            for book in seed.books:
+                assert titles.setdefault(book, book) is book
+
+    def test_definitions_are_flush_left(self):
+        """Definitions carry no common indentation to strip at load time."""
+        for definitions in DOMAIN_SEEDS.values():
+            for seed in definitions:
+                assert textwrap.dedent(seed.definition_md) == seed.definition_md
+
+    def test_all_seeds_render_with_heading(self):
+        """Every rendered seed starts with a heading."""
+        for definitions in DOMAIN_SEEDS.values():
+            for seed in definitions:
+                assert seed.render().startswith("## ")
+
+
+class TestLazyLoading:
+    """Tests for on-demand construction of seed data."""
+
+    def test_domain_seeds_mapping(self):
+        """DOMAIN_SEEDS should expose every domain like a dict."""
+        assert set(DOMAIN_SEEDS) == {"MATH", "PHYSICS", "CHEMISTRY", "BIOLOGY", "CS"}
+        assert DOMAIN_SEEDS.get("UNKNOWN", []) == []
+
+    def test_package_exports(self):
+        """Seed lists remain importable from the package."""
+        from generator.seeds import CS_AXIOM_DEFINITIONS
+
+        assert CS_AXIOM_DEFINITIONS is DOMAIN_SEEDS["CS"]
+
+    def test_domain_loaded_once(self):
+        """Modules and DOMAIN_SEEDS share one loaded tuple per domain."""
+        from generator.seeds.physics import PHYSICS_AXIOM_DEFINITIONS
+
+        assert PHYSICS_AXIOM_DEFINITIONS is DOMAIN_SEEDS["PHYSICS"]
+        assert load_domain("physics") is PHYSICS_AXIOM_DEFINITIONS
+
+    def test_module_attribute_is_cached(self):
+        """Lazily built attributes are built once and then cached."""
+        first = mathematics.MATH_AXIOM_DEFINITIONS
+
+        assert "MATH_AXIOM_DEFINITIONS" in vars(mathematics)
+        assert mathematics.MATH_AXIOM_DEFINITIONS is first
+        assert "MATH_CLOSURE" in dir(mathematics)
+
+    def test_load_rejects_cycles(self):
+        """Loading any domain checks its prerequisite graph, cached or not."""
+        cyclic = (_seed("A", prerequisites=("B",)), _seed("B", prerequisites=("A",)))
+
+        with patch.object(_cache, "load", return_value=cyclic):
+            with pytest.raises(AssertionError, match="cycle in physics"):
+                load_domain.__wrapped__("physics")
+
+    def test_load_requires_math_axioms_first(self):
+        """Math seeds must list axioms before derived concepts."""
+        misordered = (_seed("A"), _seed("B", is_axiom=True))
+
+        with patch.object(_cache, "load", return_value=misordered):
+            with pytest.raises(AssertionError, match="axioms must precede"):
+                load_domain.__wrapped__("mathematics")
+            assert load_domain.__wrapped__("physics") == misordered
+
+
+class TestMarshalCache:
+    """Tests for the marshalled seed cache."""
+
+    def test_round_trip(self, tmp_path):
+        """A fresh cache returns the definitions it was written with."""
+        defs = mathematics.MATH_AXIOM_DEFINITIONS
+        _cache.write("mathematics", defs, tmp_path)
+
+        assert _cache.load("mathematics", tmp_path) == defs
+
+    def test_missing_cache(self, tmp_path):
+        """No cache file means no cached definitions."""
+        assert _cache.load("mathematics", tmp_path) is None
+
+    def test_source_rows(self):
+        """JSON sources load as seed rows with tuple fields."""
+        seed = load_source("physics")[0]
+
+        assert seed.name == "Newton's First Law"
+        assert isinstance(seed.books, tuple)
+        assert seed.prerequisites == ()
+
+    def test_stale_cache_is_ignored(self, tmp_path):
+        """A cache built from different source is not used."""
+        _cache.write("mathematics", (), tmp_path)
+
+        with patch.object(_cache, "_source_digest", return_value=b"changed"):
+            assert _cache.load("mathematics", tmp_path) is None
+
+    def test_other_row_layout_is_ignored(self, tmp_path):
+        """A cache written for different AxiomSeed fields is not used."""
+        _cache.write("mathematics", mathematics.MATH_AXIOM_DEFINITIONS, tmp_path)
+
+        renamed = ("name", "subfield", "domain", *AxiomSeed._fields[3:])
+        with patch.object(AxiomSeed, "_fields", renamed):
+            assert _cache.load("mathematics", tmp_path) is None
+
+    def test_malformed_rows_are_ignored(self, tmp_path):
+        """Rows that do not fit AxiomSeed fall back to the JSON source."""
+        path = tmp_path / "mathematics.marshal"
+        header = (marshal.version, AxiomSeed._fields, _cache._source_digest("mathematics"))
+        path.write_bytes(marshal.dumps((*header, (("too", "short"),))))
+        assert _cache.load("mathematics", tmp_path) is None
+
+        # Caches written before the field names were recorded
+        path.write_bytes(marshal.dumps((marshal.version, header[2], ())))
+        assert _cache.load("mathematics", tmp_path) is None
+
+
+class TestAxiomPartition:
+    """Tests for the axiom/non-axiom split of the math seeds."""
+
+    def test_partition(self):
+        """Axioms are a prefix of the definitions, ending at AXIOM_END."""
+        defs = mathematics.MATH_AXIOM_DEFINITIONS
+
+        assert mathematics.MATH_AXIOMS + mathematics.MATH_NON_AXIOMS == defs
+        assert len(mathematics.MATH_AXIOMS) == mathematics.AXIOM_END
+        assert all(d.is_axiom for d in mathematics.MATH_AXIOMS)
+        assert not any(d.is_axiom for d in mathematics.MATH_NON_AXIOMS)
+
+
+class TestContentHashes:
+    """Tests for per-definition content hashes."""
+
+    def test_hashes_match_definitions(self):
+        """There is one distinct hash per definition."""
+        defs = mathematics.MATH_AXIOM_DEFINITIONS
+        hashes = mathematics.MATH_AXIOM_HASHES
+
+        assert len(hashes) == len(defs)
+        assert len(set(hashes)) == len(hashes)
+
+    def test_hashes_match_stored_definitions(self):
+        """Hashes cover the definition_md that reaches the database."""
+        defs = mathematics.MATH_AXIOM_DEFINITIONS
+
+        for seed, digest in zip(defs, mathematics.MATH_AXIOM_HASHES):
+            stored = seed.to_concept()["definition_md"]
+            assert digest == hashlib.sha256(stored.encode()).digest()
+
+
+class TestPrereqGraph:
+    """Tests for the prerequisite bitmask graph."""
+
+    def test_transitive_closure(self):
+        """Closure should include indirect prerequisites."""
+        # 0 <- 1 <- 2
+        assert transitive_closure((0b000, 0b001, 0b010)) == (0b000, 0b001, 0b011)
+
+    def test_prereq_csr(self):
+        """CSR rows list each definition's prerequisite indices."""
+        defs = [
+            _seed("A"),
+            _seed("B", prerequisites=("A",)),
+            _seed("C", prerequisites=("A", "B")),
+        ]
+
+        indptr, indices = prereq_csr(defs)
+
+        assert list(indptr) == [0, 0, 1, 3]
+        assert list(indices) == [0, 0, 1]
+
+    def test_physics_prereq_csr(self):
+        """Physics CSR rows point back at the named prerequisites."""
+        from generator.seeds.physics import PHYSICS_AXIOM_DEFINITIONS as defs
+
+        indptr, indices = prereq_csr(defs)
+
+        for i, seed in enumerate(defs):
+            row = indices[indptr[i]:indptr[i + 1]]
+            assert tuple(defs[p].name for p in row) == seed.prerequisites
+
+    def test_has_cycle(self):
+        """Cycles are detected, including self-loops."""
+        acyclic = [_seed("A"), _seed("B", prerequisites=("A",))]
+        cyclic = [_seed("A", prerequisites=("B",)), _seed("B", prerequisites=("A",))]
+        self_loop = [_seed("A", prerequisites=("A",))]
+
+        assert not has_cycle(*prereq_csr(acyclic))
+        assert has_cycle(*prereq_csr(cyclic))
+        assert has_cycle(*prereq_csr(self_loop))
+
+    def test_seed_graphs_are_acyclic(self):
+        """No seed domain contains a prerequisite cycle."""
+        for definitions in DOMAIN_SEEDS.values():
+            assert not has_cycle(*prereq_csr(definitions))
+
+    def test_topo_order(self):
+        """Prerequisites precede dependents."""
+        defs = [_seed("C", prerequisites=("B",)), _seed("A"), _seed("B", prerequisites=("A",))]
+
+        assert topo_order(*prereq_csr(defs)) == (1, 2, 0)
+
+    def test_topo_order_breaks_ties_by_index(self):
+        """A dependent that becomes ready goes ahead of later roots."""
+        defs = [_seed("A"), _seed("B", prerequisites=("A",)), _seed("C")]
+
+        assert topo_order(*prereq_csr(defs)) == (0, 1, 2)
+
+    def test_topo_order_rejects_cycles(self):
+        """Cyclic graphs cannot be ordered."""
+        cyclic = [_seed("A", prerequisites=("B",)), _seed("B", prerequisites=("A",))]
+
+        with pytest.raises(ValueError, match="cycle"):
+            topo_order(*prereq_csr(cyclic))
+
+    def test_math_topo_order(self):
+        """Every math seed appears after all of its prerequisites."""
+        defs = mathematics.MATH_AXIOM_DEFINITIONS
+        position = {defs[i].name: pos for pos, i in enumerate(mathematics.MATH_AXIOM_TOPO_ORDER)}
+
+        assert len(position) == len(defs)
+        for seed in defs:
+            for prereq in seed.prerequisites:
+                assert position[prereq] < position[seed.name]
+
+    def test_direct_prereq(self):
+        """Direct prerequisites are reported."""
+        assert is_prereq("Relation", "Function")
+
+    def test_indirect_prereq(self):
+        """Prerequisites of prerequisites are reported."""
+        assert is_prereq("Axiom of Pairing", "Countable Set")
+
+    def test_not_prereq(self):
+        """Dependents are not prerequisites of their own prerequisites."""
+        assert not is_prereq("Countable Set", "Function")
+        assert not is_prereq("Function", "Function")
+
+
+class TestSeedTable:
+    """Tests for the columnar seed table."""
+
+    def test_rows_match_definitions(self):
+        """Rows materialized from columns equal the source definitions."""
+        table = mathematics.MATH_TABLE
+
+        assert len(table) == len(mathematics.MATH_AXIOM_DEFINITIONS)
+        assert tuple(table) == mathematics.MATH_AXIOM_DEFINITIONS
+
+    def test_negative_index(self):
+        """Negative indices count from the end, prerequisites included."""
+        table = SeedTable([_seed("A"), _seed("B", prerequisites=("A",))])
+
+        assert table[-1] == table[1]
+        assert list(table.prereqs(-1)) == [0]
+
+        with pytest.raises(IndexError):
+            table[2]
+        with pytest.raises(IndexError):
+            table.prereqs(-3)
+
+    def test_query_single_field(self):
+        """Querying by one field returns the matching indices."""
+        table = mathematics.MATH_TABLE
+        defs = mathematics.MATH_AXIOM_DEFINITIONS
+
+        indices = table.query(complexity_level=0)
+
+        assert indices
+        assert indices == [i for i, d in enumerate(defs) if d.complexity_level == 0]
+
+    def test_query_multiple_fields(self):
+        """All filters must match."""
+        table = SeedTable([
+            _seed("A", subfield="x", is_axiom=True),
+            _seed("B", subfield="x"),
+            _seed("C", subfield="y", complexity_level=2),
+        ])
+
+        assert table.query(complexity_level=0, is_axiom=False) == [1]
+        assert table.query(subfield="y", name="C") == [2]
+        assert table.query(subfield="z") == []
+        assert table.query(complexity_level=99) == []
+
+    def test_query_rejects_unknown_fields(self):
+        """Filters on fields seeds do not have raise instead of matching."""
+        table = SeedTable([_seed("A", subfield="x")])
+
+        with pytest.raises(KeyError, match="typo_field"):
+            table.query(typo_field="x")
+        with pytest.raises(KeyError, match="definition_md"):
+            table.query(definition_md="x")
+
+    def test_value_rejects_unknown_fields(self):
+        """Unknown fields are not decoded as the subfield."""
+        table = SeedTable([_seed("A", subfield="x")])
+
+        assert table._value("subfield", 0) == "x"
+        with pytest.raises(KeyError, match="typo_field"):
+            table._value("typo_field", 0)
+
+    def test_packed_tags(self):
+        """Axiom flag, level and subfield id are packed into one uint16."""
+        table = SeedTable([_seed("A", subfield="b", complexity_level=3, is_axiom=True)])
+
+        assert table.tags.typecode == "H"
+        assert table.tags[0] == AXIOM_BIT | (3 << 10) | table.subfields.index("b")
+        assert table[0].complexity_level == table.complexity(0) == 3
+        assert table[0].is_axiom is table.is_axiom(0) is True
+
+    def test_get_by_name(self):
+        """Rows are looked up by name through the index."""
+        table = SeedTable([_seed("A"), _seed("B", subfield="y")])
+
+        assert table.index == {"A": 0, "B": 1}
+        assert table.get("B") == _seed("B", subfield="y")
+        assert table.get("C") is None
+        assert "A" in table
+        assert "C" not in table
+
+    def test_prereqs_stored_as_indices(self):
+        """Prerequisites resolve to row indices and back to names."""
+        table = SeedTable([
+            _seed("A"),
+            _seed("B", prerequisites=("A",)),
+            _seed("C", prerequisites=("B", "A")),
+        ])
+
+        assert "prerequisites" not in table.columns
+        assert list(table.prereqs(2)) == [1, 0]
+        assert table.prereq_names(2) == ("B", "A")
+        assert table.query(prerequisites=("A",)) == [1]
+
+    def test_duplicate_names(self):
+        """Names must be unique to be indexed."""
+        with pytest.raises(ValueError, match="Duplicate"):
+            SeedTable([_seed("A"), _seed("A")])
+
+    def test_level_out_of_range(self):
+        """Levels that do not fit in the tag are rejected."""
+        with pytest.raises(ValueError, match="Complexity level"):
+            SeedTable([_seed("A", complexity_level=32)])
+
+
+def _seed(name: str, **fields) -> AxiomSeed:
+    """Build a minimal seed definition for tests."""
+    seed = AxiomSeed(
+        name=name,
+        domain="MATH",
+        subfield="x",
+        complexity_level=0,
+        is_axiom=False,
+        books=(),
+        prerequisites=(),
+    )
+    return seed._replace(**fields)
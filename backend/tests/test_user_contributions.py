@@ -1,49 +1,124 @@
-"""Tests for user contribution endpoints."""
+"""Tests for user contribution endpoints.
 
+The app and its models are imported inside fixtures, so collecting this
+module does not load FastAPI, Firebase or the database drivers.
+"""
+
+import httpx
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+
+# Repository mocks, built once and reset by the repos fixture
+_CONCEPT_REPO = MagicMock()
+_CONTRIBUTION_REPO = MagicMock()
+# What the repositories' create() hands back; the routes never read it
+_CREATED = SimpleNamespace(id="stub-id")
+# The routes only run write queries and ignore their results
+_NEO4J_CLIENT = SimpleNamespace(execute_query=lambda query, parameters=None: [])
+
+
+@pytest.fixture(scope="module")
+def mock_user():
+    """Mock user for authenticated requests."""
+    from app.auth.firebase_auth import FirebaseUser
 
-from fastapi.testclient import TestClient
+    return FirebaseUser(
+        uid="test-user-123",
+        email="test@example.com",
+        email_verified=True,
+        display_name="Test User",
+    )
 
-from app.main import app
-from app.auth.firebase_auth import FirebaseUser
-from app.db.concept import Concept
 
+@pytest.fixture(scope="module")
+def mock_concept():
+    """Existing concept returned by the repository mock (treat as read-only)."""
+    from app.db.concept import Concept
 
-# Mock user for authenticated requests
-mock_user = FirebaseUser(
-    uid="test-user-123",
-    email="test@example.com",
-    email_verified=True,
-    display_name="Test User",
-)
+    return Concept(
+        id="math-linalg-vector-123",
+        name="Vector Space",
+        definition_md="Test",
+        domain="MATH",
+        subfield="linear_algebra",
+        complexity_level=2,
+    )
 
 
-def override_get_current_user():
-    """Override auth dependency for testing."""
-    return mock_user
+@pytest.fixture(scope="module")
+def override_get_current_user(mock_user):
+    """Auth dependency override returning the mock user, built once.
+
+    It takes no parameters: FastAPI inspects an override's signature, and a
+    default argument would surface as a query parameter.
+    """
+
+    def _override():
+        return mock_user
+
+    return _override
 
 
 @pytest.fixture
-def client():
-    """Create test client with auth override."""
-    from app.api.routes.user_contributions import router
+def repos(monkeypatch):
+    """Route the contribution endpoints to the cached repository mocks.
+
+    ``add_resource`` imports ``get_client`` when called, so it is replaced
+    on the neo4j_client module rather than on the routes module.
+    """
+    for mock in (_CONCEPT_REPO, _CONTRIBUTION_REPO):
+        mock.reset_mock(return_value=True, side_effect=True)
+        mock.create.return_value = _CREATED
+    routes = "app.api.routes.user_contributions"
+    monkeypatch.setattr(f"{routes}._concept_repo", _CONCEPT_REPO)
+    monkeypatch.setattr(f"{routes}._contribution_repo", _CONTRIBUTION_REPO)
+    monkeypatch.setattr("app.db.neo4j_client.get_client", lambda: _NEO4J_CLIENT)
+    return SimpleNamespace(
+        concept=_CONCEPT_REPO, contribution=_CONTRIBUTION_REPO, client=_NEO4J_CLIENT
+    )
+
+
+@pytest.fixture(scope="module")
+async def aclient(app):
+    """Create one async client for the whole module.
+
+    Requests go straight to the app over ASGI, without the thread portal
+    TestClient uses to drive the app from synchronous code.
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+@pytest.fixture
+def client(app, aclient, override_get_current_user, monkeypatch):
+    """The shared test client, authenticated as the mock user."""
+    from app.auth.firebase_auth import get_current_user
+
+    monkeypatch.setitem(
+        app.dependency_overrides, get_current_user, override_get_current_user
+    )
+    return aclient
+
+
+@pytest.fixture
+def unauth_client(app, aclient, monkeypatch):
+    """The shared test client, without authentication."""
     from app.auth.firebase_auth import get_current_user
 
-    app.dependency_overrides[get_current_user] = override_get_current_user
-    yield TestClient(app)
-    app.dependency_overrides.clear()
+    monkeypatch.delitem(app.dependency_overrides, get_current_user, raising=False)
+    return aclient
 
 
 class TestCreateConcept:
     """Tests for POST /api/contributions/concept."""
 
-    def test_create_concept_requires_auth(self):
+    @pytest.mark.asyncio
+    async def test_create_concept_requires_auth(self, unauth_client):
         """Test that creating a concept requires authentication."""
-        # Without auth override
-        app.dependency_overrides.clear()
-        client = TestClient(app)
-        response = client.post(
+        response = await unauth_client.post(
             "/api/contributions/concept",
             json={
                 "name": "Test Concept",
@@ -54,44 +129,44 @@ class TestCreateConcept:
         )
         assert response.status_code == 401
 
-    def test_create_concept_invalid_domain(self, client):
-        """Test that invalid domains are rejected."""
-        response = client.post(
-            "/api/contributions/concept",
-            json={
-                "name": "Test Concept",
-                "definition_md": "A test definition",
-                "domain": "INVALID",
-                "subfield": "test",
-            },
-        )
-        assert response.status_code == 400
-        assert "Invalid domain" in response.json()["detail"]
-
-    def test_create_concept_negative_complexity(self, client):
-        """Test that negative complexity levels are rejected."""
-        response = client.post(
-            "/api/contributions/concept",
-            json={
-                "name": "Test Concept",
-                "definition_md": "A test definition",
-                "domain": "MATH",
-                "subfield": "test",
-                "complexity_level": -1,
-            },
-        )
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "payload,expected_msg",
+        [
+            (
+                {
+                    "name": "Test Concept",
+                    "definition_md": "A test definition",
+                    "domain": "INVALID",
+                    "subfield": "test",
+                },
+                "Invalid domain",
+            ),
+            (
+                {
+                    "name": "Test Concept",
+                    "definition_md": "A test definition",
+                    "domain": "MATH",
+                    "subfield": "test",
+                    "complexity_level": -1,
+                },
+                "Complexity level",
+            ),
+        ],
+        ids=["invalid-domain", "negative-complexity"],
+    )
+    async def test_create_concept_validation(self, client, payload, expected_msg):
+        """Test that invalid domains and complexity levels are rejected."""
+        response = await client.post("/api/contributions/concept", json=payload)
         assert response.status_code == 400
-        assert "Complexity level" in response.json()["detail"]
+        assert expected_msg in response.json()["detail"]
 
-    @patch("app.api.routes.user_contributions._concept_repo")
-    @patch("app.api.routes.user_contributions._contribution_repo")
-    def test_create_concept_success(self, mock_contrib_repo, mock_concept_repo, client):
+    @pytest.mark.asyncio
+    async def test_create_concept_success(self, repos, client):
         """Test successful concept creation."""
-        mock_concept_repo.create.return_value = MagicMock()
-        mock_concept_repo.get_by_id.return_value = None
-        mock_contrib_repo.create.return_value = MagicMock()
+        repos.concept.get_by_id.return_value = None
 
-        response = client.post(
+        response = await client.post(
             "/api/contributions/concept",
             json={
                 "name": "Vector Space",
@@ -114,11 +189,10 @@ class TestCreateConcept:
 class TestAddResource:
     """Tests for POST /api/contributions/{concept_id}/resource."""
 
-    def test_add_resource_requires_auth(self):
+    @pytest.mark.asyncio
+    async def test_add_resource_requires_auth(self, unauth_client):
         """Test that adding a resource requires authentication."""
-        app.dependency_overrides.clear()
-        client = TestClient(app)
-        response = client.post(
+        response = await unauth_client.post(
             "/api/contributions/test-concept/resource",
             json={
                 "resource_type": "book",
@@ -127,9 +201,10 @@ class TestAddResource:
         )
         assert response.status_code == 401
 
-    def test_add_resource_invalid_type(self, client):
+    @pytest.mark.asyncio
+    async def test_add_resource_invalid_type(self, client):
         """Test that invalid resource types are rejected."""
-        response = client.post(
+        response = await client.post(
             "/api/contributions/test-concept/resource",
             json={
                 "resource_type": "invalid",
@@ -139,12 +214,12 @@ class TestAddResource:
         assert response.status_code == 400
         assert "Invalid resource type" in response.json()["detail"]
 
-    @patch("app.api.routes.user_contributions._concept_repo")
-    def test_add_resource_concept_not_found(self, mock_concept_repo, client):
+    @pytest.mark.asyncio
+    async def test_add_resource_concept_not_found(self, repos, client):
         """Test adding resource to non-existent concept."""
-        mock_concept_repo.get_by_id.return_value = None
+        repos.concept.get_by_id.return_value = None
 
-        response = client.post(
+        response = await client.post(
             "/api/contributions/nonexistent/resource",
             json={
                 "resource_type": "book",
@@ -153,25 +228,12 @@ class TestAddResource:
         )
         assert response.status_code == 404
 
-    @patch("app.api.routes.user_contributions._concept_repo")
-    @patch("app.api.routes.user_contributions._contribution_repo")
-    @patch("app.api.routes.user_contributions.get_client")
-    def test_add_book_success(self, mock_get_client, mock_contrib_repo, mock_concept_repo, client):
+    @pytest.mark.asyncio
+    async def test_add_book_success(self, repos, client, mock_concept):
         """Test successfully adding a book."""
-        mock_concept = Concept(
-            id="math-linalg-vector-123",
-            name="Vector Space",
-            definition_md="Test",
-            domain="MATH",
-            subfield="linear_algebra",
-            complexity_level=2,
-        )
-        mock_concept_repo.get_by_id.return_value = mock_concept
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
-        mock_contrib_repo.create.return_value = MagicMock()
+        repos.concept.get_by_id.return_value = mock_concept
 
-        response = client.post(
+        response = await client.post(
             "/api/contributions/math-linalg-vector-123/resource",
             json={
                 "resource_type": "book",